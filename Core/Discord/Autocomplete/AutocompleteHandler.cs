@@ -135,6 +135,13 @@ public class SearchModeAutocompleteHandler : AutocompleteHandler
 /// (user types free-text).</summary>
 public class SearchQueryAutocompleteHandler : AutocompleteHandler
 {
+    // Free-text modes answer every keystroke with one of these two fixed results, so they are built once
+    private static readonly AutocompletionResult SearchHint = AutocompletionResult.FromSuccess(
+    [
+        new AutocompleteResult("\u266b Type to search for artists, albums, or tracks", "hint_search")
+    ]);
+    private static readonly AutocompletionResult NoSuggestions = AutocompletionResult.FromSuccess([]);
+
     public override async Task<AutocompletionResult> GenerateSuggestionsAsync(IInteractionContext context,
         IAutocompleteInteraction autocompleteInteraction, IParameterInfo parameter, IServiceProvider service)
     {
@@ -182,7 +189,18 @@ public class SearchQueryAutocompleteHandler : AutocompleteHandler
         if (!string.IsNullOrWhiteSpace(input))
             filtered = filtered.Where(m => m.Name.Contains(input, StringComparison.OrdinalIgnoreCase));
         else
-            filtered = filtered.OrderBy(_ => Random.Shared.Next()); // Randomize when no filter (278 moods, Discord limit 25)
+        {
+            // Randomize when no filter (278 moods, Discord limit 25). A partial Fisher-Yates shuffle picks the
+            // 25 in one pass instead of sorting every mood by a random key on each keystroke
+            MoodTag[] pool = [.. moods];
+            int pickCount = Math.Min(25, pool.Length);
+            for (int i = 0; i < pickCount; i++)
+            {
+                int j = Random.Shared.Next(i, pool.Length);
+                (pool[i], pool[j]) = (pool[j], pool[i]);
+            }
+            filtered = pool.Take(pickCount);
+        }
 
         List<AutocompleteResult> results = filtered
             .Take(25)
@@ -219,13 +237,6 @@ public class SearchQueryAutocompleteHandler : AutocompleteHandler
         return AutocompletionResult.FromSuccess(results);
     }
 
-    private static AutocompletionResult GetSearchHint(string input)
-    {
-        if (string.IsNullOrWhiteSpace(input))
-            return AutocompletionResult.FromSuccess(
-            [
-                new AutocompleteResult("\u266b Type to search for artists, albums, or tracks", "hint_search")
-            ]);
-        return AutocompletionResult.FromSuccess([]);
-    }
+    private static AutocompletionResult GetSearchHint(string input) =>
+        string.IsNullOrWhiteSpace(input) ? SearchHint : NoSuggestions;
 }
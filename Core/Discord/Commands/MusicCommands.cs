@@ -15,7 +15,8 @@ namespace PlexBot.Core.Discord.Commands;
 
 /// <summary>Provides discord slash commands for music playback with interactive UI components to control playback and manage the music queue</summary>
 public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService playerService,
-    IAudioService audioService, MusicProviderRegistry providerRegistry, IPlexSonicService plexSonicService)
+    IAudioService audioService, MusicProviderRegistry providerRegistry, IPlexSonicService plexSonicService,
+    ITrackResolverService trackResolver)
     : InteractionModuleBase<SocketInteractionContext>
 {
 
@@ -108,9 +109,7 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
         }
 
         // Match by ID first (autocomplete sends the numeric ID), then by name
-        MoodTag? matched = moods.FirstOrDefault(m => m.Id == query)
-            ?? moods.FirstOrDefault(m => m.Name.Equals(query, StringComparison.OrdinalIgnoreCase))
-            ?? moods.FirstOrDefault(m => m.Name.Contains(query, StringComparison.OrdinalIgnoreCase));
+        MoodTag? matched = MatchTag(moods, query, m => m.Id, m => m.Name);
 
         if (matched is null)
         {
@@ -141,9 +140,7 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
         }
 
         // Match by ID first (autocomplete sends the numeric ID), then by name
-        GenreTag? matched = genres.FirstOrDefault(g => g.Id == query)
-            ?? genres.FirstOrDefault(g => g.Name.Equals(query, StringComparison.OrdinalIgnoreCase))
-            ?? genres.FirstOrDefault(g => g.Name.Contains(query, StringComparison.OrdinalIgnoreCase));
+        GenreTag? matched = MatchTag(genres, query, g => g.Id, g => g.Name);
 
         if (matched is null)
         {
@@ -186,14 +183,14 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
         }
 
         // Otherwise treat as a track search to seed radio
-        SearchResults searchResults = await plexMusicService.SearchLibraryAsync(query);
-        if (searchResults.Tracks.Count == 0)
+        List<Track> seedMatches = await plexMusicService.SearchTracksAsync(query, 1);
+        if (seedMatches.Count == 0)
         {
             await FollowupAsync(components: ComponentV2Builder.Error("No Results", $"No tracks found for '{query}'. Try a different search term."), ephemeral: true);
             return;
         }
 
-        Track seedTrack = searchResults.Tracks.First();
+        Track seedTrack = seedMatches[0];
         string ratingKey = PlexJsonParser.ExtractRatingKey(seedTrack.SourceKey);
         if (string.IsNullOrEmpty(ratingKey))
         {
@@ -424,11 +421,14 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
                 await ackMessage.ModifyAsync(msg => { msg.Components = ComponentV2Builder.Info("Empty Playlist", $"Playlist '{playlistDetails.Title}' is empty."); msg.Embed = null; msg.Flags = MessageFlags.ComponentsV2; });
                 return;
             }
-            List<Track> tracks = playlistDetails.Tracks;
+            // The details may be the cached instance, so shuffling works on a copy. Random.Shared.Shuffle is a
+            // single in-place pass, unlike sorting on random keys; the whole batch is then queued in one bulk add.
+            IEnumerable<Track> tracks = playlistDetails.Tracks;
             if (shuffle)
             {
-                Random rng = new();
-                tracks = [.. tracks.OrderBy(x => rng.Next())];
+                Track[] shuffled = [.. playlistDetails.Tracks];
+                Random.Shared.Shuffle(shuffled);
+                tracks = shuffled;
             }
             await playerService.AddToQueueAsync(Context.Interaction, tracks);
         }
@@ -522,28 +522,57 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
                 }
             }
 
-            using CancellationTokenSource cts = new(TimeSpan.FromSeconds(30));
-            TrackLoadResult loadResult = await audioService.Tracks.LoadTracksAsync(
-                url, TrackSearchMode.None, cancellationToken: cts.Token);
-
-            LavalinkTrack? lavalinkTrack = loadResult.Track;
-            if (lavalinkTrack is null)
+            // Replaying a single-track URL reuses the earlier load instead of asking Lavalink to extract it again.
+            // Links carrying a list= parameter may expand to a playlist, so those always go to Lavalink.
+            bool isPlaylist = false;
+            IReadOnlyList<LavalinkTrack> loadedTracks;
+            if (HttpUtility.ParseQueryString(parsedUri.Query)["list"] is null
+                && trackResolver.TryGetCached(url, out LavalinkTrack? cachedTrack))
+            {
+                Logs.Debug($"URL resolve cache hit: {url}");
+                loadedTracks = [cachedTrack];
+            }
+            else
+            {
+                using CancellationTokenSource cts = new(TimeSpan.FromSeconds(30));
+                TrackLoadResult loadResult = await audioService.Tracks.LoadTracksAsync(
+                    url, TrackSearchMode.None, cancellationToken: cts.Token);
+
+                // Pure playlist URLs come back fully loaded in this one request, so every entry is queued from it.
+                // A video opened inside a list (watch?v=X&list=..., Mix/RD links) loads as a playlist with that
+                // video selected; those keep single-video behaviour and queue only the clicked track.
+                LavalinkTrack? selectedTrack = loadResult.Playlist?.SelectedTrack;
+                isPlaylist = loadResult.IsPlaylist && selectedTrack is null;
+                loadedTracks = isPlaylist
+                    ? loadResult.Tracks
+                    : (selectedTrack ?? loadResult.Track) is LavalinkTrack single ? [single] : [];
+            }
+            if (loadedTracks.Count == 0)
             {
                 await FollowupAsync(components: ComponentV2Builder.Error("Not Found",
                     "Could not load a playable track from this URL."), ephemeral: true);
                 return;
             }
 
-            Track track = Track.CreateFromUrl(
-                lavalinkTrack.Title ?? "Unknown Title",
-                lavalinkTrack.Author ?? "Unknown Artist",
-                url,
-                lavalinkTrack.ArtworkUri?.ToString() ?? "",
-                "external");
-            track.DurationMs = (long)lavalinkTrack.Duration.TotalMilliseconds;
-            track.DurationDisplay = FormatHelper.FormatDuration(lavalinkTrack.Duration);
+            List<Track> tracks = new(loadedTracks.Count);
+            foreach (LavalinkTrack lavalinkTrack in loadedTracks)
+            {
+                string playbackUrl = isPlaylist ? lavalinkTrack.Uri?.ToString() ?? url : url;
+                Track track = Track.CreateFromUrl(
+                    lavalinkTrack.Title ?? "Unknown Title",
+                    lavalinkTrack.Author ?? "Unknown Artist",
+                    playbackUrl,
+                    lavalinkTrack.ArtworkUri?.ToString() ?? "",
+                    "external");
+                track.DurationMs = (long)lavalinkTrack.Duration.TotalMilliseconds;
+                track.DurationDisplay = FormatHelper.FormatDuration(lavalinkTrack.Duration);
+
+                // Seed the resolver so queueing reuses this load instead of asking Lavalink for the same URL again
+                trackResolver.CacheResolved(playbackUrl, lavalinkTrack);
+                tracks.Add(track);
+            }
 
-            await playerService.AddToQueueAsync(Context.Interaction, [track]);
+            await playerService.AddToQueueAsync(Context.Interaction, tracks);
         }
         catch (Exception ex)
         {
@@ -577,6 +606,24 @@ public class MusicCommands(IPlexMusicService plexMusicService, IPlayerService pl
         }
     }
 
+    /// <summary>Finds a tag in a single pass, preferring an exact ID match, then an exact name, then a partial name</summary>
+    private static T? MatchTag<T>(List<T> tags, string query, Func<T, string> getId, Func<T, string> getName) where T : class
+    {
+        T? nameMatch = null;
+        T? partialMatch = null;
+        foreach (T tag in tags)
+        {
+            if (getId(tag) == query) return tag;
+            if (nameMatch is not null) continue;
+            string name = getName(tag);
+            if (name.Equals(query, StringComparison.OrdinalIgnoreCase))
+                nameMatch = tag;
+            else if (partialMatch is null && name.Contains(query, StringComparison.OrdinalIgnoreCase))
+                partialMatch = tag;
+        }
+        return nameMatch ?? partialMatch;
+    }
+
     /// <summary>Ensures description fits Discord's 100-char select menu option limit</summary>
     public static string TruncateDescription(string? description, int maxLength = 100)
     {
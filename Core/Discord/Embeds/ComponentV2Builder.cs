@@ -34,44 +34,34 @@ public static class ComponentV2Builder
     public static MessageComponent Warning(string title, string description)
         => BuildStatusMessage(WarningColor, WarningEmoji, title, description);
 
+    // Only permission failures carry a per-call reason; the other command errors have fixed text, so each
+    // component is built once and reused like the help display
+    private static readonly Lazy<MessageComponent> UnknownCommandError = new(() =>
+        Error("Unknown Command", "This command is not recognized. It may have been removed or updated."));
+    private static readonly Lazy<MessageComponent> BadArgsError = new(() =>
+        Error("Invalid Arguments", "The command arguments were invalid. Please check your input and try again."));
+    private static readonly Lazy<MessageComponent> ExceptionError = new(() =>
+        Error("Command Error", "An error occurred while processing your command. Please try again later."));
+    private static readonly Lazy<MessageComponent> UnknownError = new(() =>
+        Error("Unknown Error", "An unknown error occurred. Please try again later."));
+
     /// <summary>Creates a command error message matching the existing error type handling</summary>
     public static MessageComponent CommandError(InteractionCommandError? errorType, string errorReason)
     {
-        string title;
-        string description;
-        if (errorType.HasValue)
-        {
-            switch (errorType.Value)
-            {
-                case InteractionCommandError.UnmetPrecondition:
-                    title = "Permission Denied";
-                    description = $"You don't have permission to use this command: {errorReason}";
-                    break;
-                case InteractionCommandError.UnknownCommand:
-                    title = "Unknown Command";
-                    description = "This command is not recognized. It may have been removed or updated.";
-                    break;
-                case InteractionCommandError.BadArgs:
-                    title = "Invalid Arguments";
-                    description = "The command arguments were invalid. Please check your input and try again.";
-                    break;
-                case InteractionCommandError.Exception:
-                    title = "Command Error";
-                    description = "An error occurred while processing your command. Please try again later.";
-                    Logs.Error($"Command exception: {errorReason}");
-                    break;
-                default:
-                    title = "Unknown Error";
-                    description = "An unknown error occurred. Please try again later.";
-                    break;
-            }
-        }
-        else
+        switch (errorType)
         {
-            title = "Unknown Error";
-            description = "An unknown error occurred. Please try again later.";
+            case InteractionCommandError.UnmetPrecondition:
+                return Error("Permission Denied", $"You don't have permission to use this command: {errorReason}");
+            case InteractionCommandError.UnknownCommand:
+                return UnknownCommandError.Value;
+            case InteractionCommandError.BadArgs:
+                return BadArgsError.Value;
+            case InteractionCommandError.Exception:
+                Logs.Error($"Command exception: {errorReason}");
+                return ExceptionError.Value;
+            default:
+                return UnknownError.Value;
         }
-        return Error(title, description);
     }
 
     /// <summary>Creates an info message with additional interactive components (select menus, buttons)</summary>
@@ -175,8 +165,13 @@ public static class ComponentV2Builder
         return new ComponentBuilderV2().WithContainer(container).Build();
     }
 
+    // The help content never changes at runtime, so the component is built once and reused
+    private static readonly Lazy<MessageComponent> HelpComponent = new(CreateHelp);
+
     /// <summary>Builds the help command display</summary>
-    public static MessageComponent BuildHelp()
+    public static MessageComponent BuildHelp() => HelpComponent.Value;
+
+    private static MessageComponent CreateHelp()
     {
         return new ComponentBuilderV2()
             .WithContainer(new ContainerBuilder()
@@ -232,6 +227,14 @@ public static class ComponentV2Builder
     private static readonly bool UseCustomEmoji;
     private static readonly int MiddleSegmentCount;
 
+    // The zero-progress bar never changes, so it is built once instead of on every idle status update
+    private static readonly string? EmptyCustomBar;
+
+    // A track's length is fixed while it plays, so its text is formatted once and reused on every progress tick
+    private static FormattedDuration? _lastDuration;
+
+    private sealed record FormattedDuration(TimeSpan Duration, string Text);
+
     static ComponentV2Builder()
     {
         // Progress bar size from config
@@ -266,7 +269,10 @@ public static class ComponentV2Builder
         UseCustomEmoji = LeftCapLevels != null && MidLevels != null && RightCapLevels != null;
 
         if (UseCustomEmoji)
+        {
+            EmptyCustomBar = LeftCapLevels![0] + string.Concat(Enumerable.Repeat(MidLevels![0], MiddleSegmentCount)) + RightCapLevels![0];
             Logs.Info("Progress bar: Using custom Discord emoji (all 30 IDs loaded)");
+        }
         else
             Logs.Warning("Progress bar: Some emoji IDs are missing or invalid, falling back to unicode");
     }
@@ -317,23 +323,23 @@ public static class ComponentV2Builder
         int totalSegments = middleSegments + 2; // left cap + middle + right cap
 
         if (position == null || duration == null || duration.Value.TotalSeconds < 1)
-        {
-            string emptyBar = LeftCapLevels![0]
-                + string.Concat(Enumerable.Repeat(MidLevels![0], middleSegments))
-                + RightCapLevels![0];
-            return $"` 0:00 `{emptyBar}` 0:00 `";
-        }
+            return $"` 0:00 `{EmptyCustomBar}` 0:00 `";
 
         double progress = Math.Clamp(position.Value.TotalSeconds / duration.Value.TotalSeconds, 0, 1);
         double fillPosition = progress * totalSegments;
         int activeSegment = (int)fillPosition;
 
-        var bar = new System.Text.StringBuilder();
+        // Bind the level arrays once; this runs every second while a track is playing
+        string[] leftLevels = LeftCapLevels!;
+        string[] midLevels = MidLevels!;
+        string[] rightLevels = RightCapLevels!;
+
+        var bar = new System.Text.StringBuilder(EmptyCustomBar!.Length + totalSegments);
         for (int i = 0; i < totalSegments; i++)
         {
-            string[] levels = i == 0 ? LeftCapLevels!
-                : i == totalSegments - 1 ? RightCapLevels!
-                : MidLevels!;
+            string[] levels = i == 0 ? leftLevels
+                : i == totalSegments - 1 ? rightLevels
+                : midLevels;
 
             int maxLevel = levels.Length - 1;
 
@@ -350,7 +356,7 @@ public static class ComponentV2Builder
         }
 
         string posStr = FormatTime(position.Value);
-        string durStr = FormatTime(duration.Value);
+        string durStr = FormatDurationCached(duration.Value);
         return $"` {posStr} `{bar}` {durStr} `";
     }
 
@@ -372,16 +378,28 @@ public static class ComponentV2Builder
 
         string bar = new string(filled, filledCount) + new string(empty, barLength - filledCount);
         string posStr = FormatTime(position.Value);
-        string durStr = FormatTime(duration.Value);
+        string durStr = FormatDurationCached(duration.Value);
         return $"` {posStr} `{bar}` {durStr} `";
     }
 
+    /// <summary>Formats a track duration, reusing the previous text when the duration hasn't changed</summary>
+    private static string FormatDurationCached(TimeSpan duration)
+    {
+        FormattedDuration? last = _lastDuration;
+        if (last?.Duration == duration)
+            return last.Text;
+
+        string text = FormatTime(duration);
+        _lastDuration = new FormattedDuration(duration, text);
+        return text;
+    }
+
     /// <summary>Formats a TimeSpan as m:ss or h:mm:ss</summary>
     private static string FormatTime(TimeSpan ts)
     {
-        return ts.TotalHours >= 1
+        return ts.Ticks >= TimeSpan.TicksPerHour
             ? ts.ToString(@"h\:mm\:ss")
-            : $"{(int)ts.TotalMinutes}:{ts.Seconds:D2}";
+            : $"{ts.Minutes}:{ts.Seconds:D2}";
     }
 
     /// <summary>Builds the radio options panel shown when the Radio button is clicked on the visual player</summary>
@@ -113,49 +113,6 @@ namespace PlexBot.Core.Discord.Embeds
             return embed.Build();
         }
 
-        /// <summary>Creates a command error embed for interaction failures</summary>
-        /// <param name="errorType">The type of error that occurred</param>
-        /// <param name="errorReason">The reason for the error</param>
-        /// <returns>A configured embed builder</returns>
-        public static Embed CommandError(InteractionCommandError? errorType, string errorReason)
-        {
-            string title;
-            string description;
-            if (errorType.HasValue)
-            {
-                switch (errorType.Value)
-                {
-                    case InteractionCommandError.UnmetPrecondition:
-                        title = "Permission Denied";
-                        description = $"You don't have permission to use this command: {errorReason}";
-                        break;
-                    case InteractionCommandError.UnknownCommand:
-                        title = "Unknown Command";
-                        description = "This command is not recognized. It may have been removed or updated.";
-                        break;
-                    case InteractionCommandError.BadArgs:
-                        title = "Invalid Arguments";
-                        description = "The command arguments were invalid. Please check your input and try again.";
-                        break;
-                    case InteractionCommandError.Exception:
-                        title = "Command Error";
-                        description = "An error occurred while processing your command. Please try again later.";
-                        Logs.Error($"Command exception: {errorReason}");
-                        break;
-                    default:
-                        title = "Unknown Error";
-                        description = "An unknown error occurred. Please try again later.";
-                        break;
-                }
-            }
-            else
-            {
-                title = "Unknown Error";
-                description = "An unknown error occurred. Please try again later.";
-            }
-            return Error(title, description);
-        }
-
         /// <summary>Builds a player embed with track information and image.
         /// Creates a rich Discord embed that displays the current track's details.</summary>
         /// <param name="track">Dictionary containing track information</param>
@@ -187,66 +144,5 @@ namespace PlexBot.Core.Discord.Embeds
                     .WithColor(ErrorColor);
             }
         }
-
-        /// <summary>Builds a queue embed showing the current queue state.
-        /// Creates a paginated embed display of the track queue.</summary>
-        /// <param name="queue">List of tracks in the queue</param>
-        /// <param name="currentTrack">The currently playing track</param>
-        /// <param name="currentPage">The current page to display</param>
-        /// <param name="itemsPerPage">Number of items to show per page</param>
-        /// <returns>An EmbedBuilder with the configured embed</returns>
-        public static EmbedBuilder BuildQueueEmbed(IReadOnlyList<CustomTrackQueueItem> queue, CustomTrackQueueItem? currentTrack,
-            int currentPage, int itemsPerPage = 10)
-        {
-            try
-            {
-                // Calculate pagination info
-                int totalTracks = queue.Count;
-                int totalPages = (totalTracks + itemsPerPage - 1) / itemsPerPage;
-                currentPage = Math.Clamp(currentPage, 1, Math.Max(1, totalPages));
-                // Create the base embed
-                EmbedBuilder embed = new EmbedBuilder()
-                    .WithTitle($"{QueueEmoji} Current Music Queue")
-                    .WithColor(MusicColor)
-                    .WithFooter($"Page {currentPage} of {totalPages} ({totalTracks} Queued Tracks)")
-                    .WithCurrentTimestamp();
-                // Add the currently playing track (only on first page)
-                if (currentPage == 1 && currentTrack != null)
-                {
-                    embed.AddField(
-                        $"{PlayEmoji} Now Playing: {currentTrack.Title}",
-                        $"Artist: {currentTrack.Artist}\nAlbum: {currentTrack.Album}\nDuration: {currentTrack.Duration}",
-                        inline: false
-                    );
-                }
-                // Add queue items for the current page
-                int startIndex = (currentPage - 1) * itemsPerPage;
-                int endIndex = Math.Min(startIndex + itemsPerPage, totalTracks);
-                for (int i = startIndex; i < endIndex; i++)
-                {
-                    CustomTrackQueueItem item = queue[i];
-                    embed.AddField(
-                        $"#{i + 1}: {item.Title}",
-                        $"Artist: {item.Artist}\nAlbum: {item.Album}\nDuration: {item.Duration}",
-                        inline: true
-                    );
-                }
-                // If queue is empty, show a message
-                if (totalTracks == 0 && currentTrack == null)
-                {
-                    embed.WithDescription("The queue is currently empty.");
-                }
-                return embed;
-            }
-            catch (Exception ex)
-            {
-                Logs.Error($"Failed to build queue embed: {ex.Message}");
-                // Return a simple fallback embed
-                return new EmbedBuilder()
-                    .WithTitle($"{ErrorEmoji} Queue")
-                    .WithDescription("An error occurred while building the queue display.")
-                    .WithColor(ErrorColor);
-            }
-        }
     }
 }
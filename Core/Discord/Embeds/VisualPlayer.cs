@@ -12,8 +12,19 @@ public class VisualPlayer(
     DiscordButtonBuilder buttonBuilder,
     ITrackPrefetchService prefetchService) : IDisposable
 {
+    // Track starts, resumes, the loop itself and shutdown all start or stop the timer from different threads;
+    // swapping it under one lock guarantees a single progress loop and never cancels a disposed source
+    private readonly object _progressLock = new();
     private CancellationTokenSource? _progressCts;
 
+    // The canvas keeps PNG for its transparent rounded corners; fastest deflate level is far cheaper
+    // to encode and only slightly larger for the mostly-blurred image
+    private static readonly PngEncoder _playerImageEncoder = new()
+    {
+        CompressionLevel = PngCompressionLevel.BestSpeed,
+        ColorType = PngColorType.RgbWithAlpha
+    };
+
     /// <summary>Updates or creates the player UI with current track information and buttons using Components V2</summary>
     public async Task AddOrUpdateVisualPlayerAsync(ComponentBuilder components, bool recreateImage = false)
     {
@@ -40,6 +51,9 @@ public class VisualPlayer(
                     msg.Flags = MessageFlags.ComponentsV2;
                 }).ConfigureAwait(false);
                 Logs.Debug("Updated player via CV2 successfully");
+                // The progress loop exits on pause, so a resume brings it back
+                if (stateManager.UseProgressBar && player?.State == PlayerState.Playing)
+                    StartProgressTimer(onlyIfStopped: true);
                 return;
             }
 
@@ -66,10 +80,7 @@ public class VisualPlayer(
                 {
                     if (stateManager.UseModernPlayer)
                     {
-                        using MemoryStream memoryStream = new();
-                        using SixLabors.ImageSharp.Image image = await ImageBuilder.BuildPlayerImageAsync(currentTrack, player, upcomingTracks, prefetchService);
-                        await image.SaveAsync(memoryStream, new PngEncoder());
-                        memoryStream.Position = 0;
+                        using MemoryStream memoryStream = await RenderPlayerImageAsync(currentTrack, player, upcomingTracks);
                         FileAttachment fileAttachment = new(memoryStream, "playerImage.png");
                         MessageComponent cv2 = ComponentV2Builder.BuildModernPlayer(statusLine, components);
                         await stateManager.CurrentPlayerMessage.ModifyAsync(msg =>
@@ -83,11 +94,15 @@ public class VisualPlayer(
                     else
                     {
                         MessageComponent cv2 = BuildClassicCV2(player, statusLine, components);
+                        // Only clear attachments left over from a modern-player image; specifying them on every
+                        // edit forces a multipart upload request even when there is nothing to remove
+                        bool hasAttachments = stateManager.CurrentPlayerMessage.Attachments.Count > 0;
                         await stateManager.CurrentPlayerMessage.ModifyAsync(msg =>
                         {
                             msg.Components = cv2;
                             msg.Embed = null;
-                            msg.Attachments = new List<FileAttachment>();
+                            if (hasAttachments)
+                                msg.Attachments = new List<FileAttachment>();
                             msg.Flags = MessageFlags.ComponentsV2;
                         }).ConfigureAwait(false);
                     }
@@ -111,10 +126,7 @@ public class VisualPlayer(
             // Create new player message
             if (stateManager.UseModernPlayer)
             {
-                using MemoryStream memoryStream = new();
-                using SixLabors.ImageSharp.Image image = await ImageBuilder.BuildPlayerImageAsync(currentTrack, player, upcomingTracks, prefetchService);
-                await image.SaveAsync(memoryStream, new PngEncoder());
-                memoryStream.Position = 0;
+                using MemoryStream memoryStream = await RenderPlayerImageAsync(currentTrack, player, upcomingTracks);
                 FileAttachment fileAttachment = new(memoryStream, "playerImage.png");
                 MessageComponent cv2 = ComponentV2Builder.BuildModernPlayer(statusLine, components);
                 stateManager.CurrentPlayerMessage = await stateManager.CurrentPlayerChannel!.SendFileAsync(
@@ -133,45 +145,80 @@ public class VisualPlayer(
         }
     }
 
+    /// <summary>Renders and encodes the player image on the thread pool so the CPU-heavy decode, blur and
+    /// encode don't run inline on the Lavalink event dispatch that called us</summary>
+    private Task<MemoryStream> RenderPlayerImageAsync(CustomTrackQueueItem currentTrack, CustomLavaLinkPlayer player,
+        List<CustomTrackQueueItem> upcomingTracks)
+    {
+        return Task.Run(async () =>
+        {
+            MemoryStream memoryStream = new();
+            using SixLabors.ImageSharp.Image image = await ImageBuilder.BuildPlayerImageAsync(currentTrack, player, upcomingTracks, prefetchService);
+            await image.SaveAsync(memoryStream, _playerImageEncoder);
+            memoryStream.Position = 0;
+            return memoryStream;
+        });
+    }
+
     /// <summary>Stops the progress timer (call when player is killed/stopped)</summary>
     public void StopProgressTimer()
     {
-        _progressCts?.Cancel();
-        _progressCts?.Dispose();
-        _progressCts = null;
+        lock (_progressLock)
+        {
+            _progressCts?.Cancel();
+            _progressCts?.Dispose();
+            _progressCts = null;
+        }
     }
 
-    /// <summary>Starts the background progress bar update loop</summary>
-    private void StartProgressTimer()
+    /// <summary>Starts the background progress bar update loop, replacing any loop already running</summary>
+    /// <param name="onlyIfStopped">Leave a running loop alone instead of restarting it</param>
+    private void StartProgressTimer(bool onlyIfStopped = false)
     {
-        StopProgressTimer();
-        _progressCts = new CancellationTokenSource();
-        _ = RunProgressUpdateLoop(_progressCts.Token);
+        CancellationToken token;
+        lock (_progressLock)
+        {
+            if (onlyIfStopped && _progressCts != null) return;
+            _progressCts?.Cancel();
+            _progressCts?.Dispose();
+            _progressCts = new CancellationTokenSource();
+            token = _progressCts.Token;
+        }
+        _ = RunProgressUpdateLoop(token);
+    }
+
+    /// <summary>Clears the timer when its loop exits on its own, unless a newer loop has already replaced it</summary>
+    private void ReleaseProgressTimer(CancellationToken ct)
+    {
+        lock (_progressLock)
+        {
+            if (_progressCts is null || _progressCts.Token != ct) return;
+            _progressCts.Dispose();
+            _progressCts = null;
+        }
     }
 
     /// <summary>Periodically updates the player status line with current track progress</summary>
     private async Task RunProgressUpdateLoop(CancellationToken ct)
     {
+        // One timer for the lifetime of the loop instead of a fresh Task.Delay timer every tick
+        using PeriodicTimer timer = new(TimeSpan.FromSeconds(1));
         try
         {
-            while (!ct.IsCancellationRequested)
+            while (await timer.WaitForNextTickAsync(ct).ConfigureAwait(false))
             {
-                await Task.Delay(TimeSpan.FromSeconds(1), ct).ConfigureAwait(false);
-                if (ct.IsCancellationRequested) break;
 
                 ulong guildId = stateManager.CurrentPlayerChannel?.GuildId ?? 0;
                 if (guildId == 0 || stateManager.CurrentPlayerMessage == null) continue;
 
                 var player = await audioService.Players.GetPlayerAsync(guildId).ConfigureAwait(false) as CustomLavaLinkPlayer;
-                if (player == null || player.State == PlayerState.NotPlaying || player.State == PlayerState.Destroyed)
+                // Stop ticking while paused too: the position isn't moving, and the resume update restarts the loop
+                if (player == null || player.State is PlayerState.NotPlaying or PlayerState.Destroyed or PlayerState.Paused)
                 {
-                    StopProgressTimer();
+                    ReleaseProgressTimer(ct);
                     return;
                 }
 
-                // Skip update if paused (position isn't moving)
-                if (player.State == PlayerState.Paused) continue;
-
                 try
                 {
                     ButtonContext context = new() { Player = player };
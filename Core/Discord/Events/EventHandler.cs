@@ -14,6 +14,14 @@ public class DiscordEventHandler(DiscordSocketClient client, InteractionService
 {
     private bool _modulesRegistered;
 
+    // Error follow-ups are REST calls against the bot's global rate limit; a burst of failing commands in one channel
+    // would otherwise spend it on error messages, so each channel gets a few follow-ups per window and the rest are
+    // only logged. Initial responses are always sent, since an unanswered interaction shows as failed to the user
+    private const int MaxErrorRepliesPerWindow = 3;
+    private static readonly TimeSpan ErrorReplyWindow = TimeSpan.FromSeconds(10);
+    private readonly object _errorReplyLock = new();
+    private readonly Dictionary<ulong, Queue<DateTime>> _recentErrorReplies = [];
+
     /// <summary>Initializes Discord event handlers for logging, ready events, and interactions</summary>
     /// <returns>A task representing the asynchronous operation</returns>
     public Task InitializeAsync()
@@ -116,8 +124,11 @@ public class DiscordEventHandler(DiscordSocketClient client, InteractionService
                     if (status.Length > 128) status = status[..125] + "...";
                     await client.SetGameAsync(status, type: ActivityType.Listening);
                 });
-                eventBus.Subscribe(BotEvents.TrackEnded, async _ =>
+                eventBus.Subscribe(BotEvents.TrackEnded, async e =>
                 {
+                    // The next TrackStarted sets the status anyway, so skip the redundant gateway update
+                    if (e.Data.GetValueOrDefault("hasNext") is true)
+                        return;
                     await client.SetGameAsync("/help", type: ActivityType.Listening);
                 });
                 eventBus.Subscribe(BotEvents.PlayerDestroyed, async _ =>
@@ -174,19 +185,9 @@ public class DiscordEventHandler(DiscordSocketClient client, InteractionService
                     return;
 
                 // Create a standardized error using our CV2 utility
-                var errorComponents = result.Error.HasValue
+                await SendErrorReplyAsync(interaction, result.Error.HasValue
                     ? ComponentV2Builder.CommandError(result.Error.Value, result.ErrorReason)
-                    : ComponentV2Builder.Error("Command Error", result.ErrorReason);
-
-                // Respond with the error
-                if (!interaction.HasResponded)
-                {
-                    await interaction.RespondAsync(components: errorComponents, ephemeral: true);
-                }
-                else
-                {
-                    await interaction.FollowupAsync(components: errorComponents, ephemeral: true);
-                }
+                    : ComponentV2Builder.Error("Command Error", result.ErrorReason));
             }
         }
         catch (Exception ex)
@@ -200,27 +201,65 @@ public class DiscordEventHandler(DiscordSocketClient client, InteractionService
             }
 
             Logs.Error($"Error handling interaction: {ex.Message}");
+            await SendErrorReplyAsync(interaction, ComponentV2Builder.Error("Command Error",
+                "An unexpected error occurred while processing your command. Please try again later."));
+        }
+    }
 
-            // Create a standardized error for exceptions
-            var exceptionComponents = ComponentV2Builder.Error("Command Error",
-                "An unexpected error occurred while processing your command. Please try again later.");
+    /// <summary>Single reply path for failed interactions: always answers an unacknowledged interaction, and applies
+    /// the per-channel error limit only to follow-ups on interactions that were already answered</summary>
+    private async Task SendErrorReplyAsync(SocketInteraction interaction, MessageComponent errorComponents)
+    {
+        try
+        {
+            if (!interaction.HasResponded)
+            {
+                await interaction.RespondAsync(components: errorComponents, ephemeral: true);
+            }
+            else if (TryReserveErrorReply(interaction))
+            {
+                await interaction.FollowupAsync(components: errorComponents, ephemeral: true);
+            }
+            else
+            {
+                Logs.Warning($"Suppressed error follow-up in channel {interaction.ChannelId}: too many errors");
+            }
+        }
+        catch (Exception responseEx)
+        {
+            Logs.Debug($"Failed to send error response (interaction likely expired): {responseEx.Message}");
+        }
+    }
 
-            // Try to respond with an error message if we haven't already
-            try
+    /// <summary>Returns true if another error follow-up may be sent to the interaction's channel in the current window,
+    /// recording it if so. Expired timestamps are dropped as they are seen, and idle channels are removed.</summary>
+    private bool TryReserveErrorReply(SocketInteraction interaction)
+    {
+        ulong channelId = interaction.ChannelId ?? 0;
+        DateTime now = DateTime.UtcNow;
+        lock (_errorReplyLock)
+        {
+            if (!_recentErrorReplies.TryGetValue(channelId, out Queue<DateTime>? replies))
             {
-                if (!interaction.HasResponded)
-                {
-                    await interaction.RespondAsync(components: exceptionComponents, ephemeral: true);
-                }
-                else
-                {
-                    await interaction.FollowupAsync(components: exceptionComponents, ephemeral: true);
-                }
+                replies = new Queue<DateTime>(MaxErrorRepliesPerWindow);
+                _recentErrorReplies[channelId] = replies;
             }
-            catch (Exception responseEx)
+            while (replies.Count > 0 && now - replies.Peek() > ErrorReplyWindow)
+                replies.Dequeue();
+            if (replies.Count >= MaxErrorRepliesPerWindow)
+                return false;
+            replies.Enqueue(now);
+
+            // Keep the map bounded to channels that have errored recently
+            if (_recentErrorReplies.Count > 100)
             {
-                Logs.Debug($"Failed to send error response (interaction likely expired): {responseEx.Message}");
+                foreach (KeyValuePair<ulong, Queue<DateTime>> entry in _recentErrorReplies.ToList())
+                {
+                    if (now - entry.Value.Last() > ErrorReplyWindow)
+                        _recentErrorReplies.Remove(entry.Key);
+                }
             }
+            return true;
         }
     }
 
@@ -19,12 +19,13 @@ namespace PlexBot.Core.Discord.Interactions;
 public class MusicInteractionHandler(IPlayerService playerService,
     VisualPlayer visualPlayer, DiscordButtonBuilder buttonBuilder,
     MusicProviderRegistry providerRegistry, IPlexSonicService plexSonicService,
-    RadioSessionManager radioSessionManager, IPlexMusicService plexMusicService) : InteractionModuleBase<SocketInteractionContext>
+    RadioSessionManager radioSessionManager, IPlexMusicService plexMusicService, IAudioService audioService) : InteractionModuleBase<SocketInteractionContext>
 {
 
     // Cooldown tracking to prevent spamming
     private static readonly ConcurrentDictionary<(ulong UserId, string CommandId), DateTime> _lastInteracted = new();
     private static readonly TimeSpan _cooldownPeriod = TimeSpan.FromSeconds(2);
+    private static long _lastPruneTicks;
 
     /// <summary>Routes select menu choices to the correct handler by decoding the provider ID and content type
     /// from the custom ID pattern search:{providerId}:{type}</summary>
@@ -132,34 +133,50 @@ public class MusicInteractionHandler(IPlayerService playerService,
     }
 
     /// <summary>"options" creates a new ephemeral panel from the main player; all other actions
-    /// (view, shuffle, clear, pagination) edit that same panel in-place via DEFERRED_UPDATE_MESSAGE</summary>
+    /// (view, shuffle, clear, pagination) edit that same panel in-place as the interaction's response</summary>
     [ComponentInteraction("queue_options:*:*")]
     public async Task HandleQueueOptionsAsync(string action, string pageStr)
     {
         string normalizedAction = action.ToLowerInvariant();
         bool isInitialOpen = normalizedAction == "options";
+        bool isPageTurn = normalizedAction == "view";
 
+        // Page turns skip the deferral: the edit itself answers the interaction (UPDATE_MESSAGE), so a page turn
+        // is one request instead of a deferral followed by a separate edit. Everything else defers first: opening
+        // sends a new panel, and shuffle/clear wait on the guild's queue lock, which can outlast Discord's 3-second window
         if (isInitialOpen)
             await DeferAsync(ephemeral: true);
-        else
-            await DeferAsync(); // DEFERRED_UPDATE_MESSAGE — edits the ephemeral panel
+        else if (!isPageTurn)
+            await DeferAsync();
 
         if (IsOnCooldown(Context.User.Id, $"queue_options:{action}"))
         {
             if (isInitialOpen)
                 await FollowupAsync(components: ComponentV2Builder.Error("Cooldown", "Please wait a moment before clicking again."), ephemeral: true);
+            else if (!Context.Interaction.HasResponded)
+                await DeferAsync();
             return;
         }
         SocketInteraction interaction = Context.Interaction;
         try
         {
-            if (await playerService.GetPlayerAsync(interaction, false) is not CustomLavaLinkPlayer player)
+            // GetPlayerAsync reports failures as followups, which need an answered interaction, so a page turn
+            // checks the voice channel itself and looks the player up directly
+            if (isPageTurn && Context.User is not IGuildUser { VoiceChannel: not null })
+            {
+                await UpdateQueuePanelAsync(ComponentV2Builder.Error("No Player", "You must be in a voice channel to use the music player."));
+                return;
+            }
+            CustomLavaLinkPlayer? player = isPageTurn
+                ? await audioService.Players.GetPlayerAsync(Context.Guild.Id) as CustomLavaLinkPlayer
+                : await playerService.GetPlayerAsync(interaction, false) as CustomLavaLinkPlayer;
+            if (player is null)
             {
                 MessageComponent errorMsg = ComponentV2Builder.Error("No Player", "No active player found.");
                 if (isInitialOpen)
                     await FollowupAsync(components: errorMsg, ephemeral: true);
                 else
-                    await interaction.ModifyOriginalResponseAsync(msg => { msg.Components = errorMsg; msg.Embed = null; msg.Flags = MessageFlags.ComponentsV2; });
+                    await UpdateQueuePanelAsync(errorMsg);
                 return;
             }
             ButtonContext context = new()
@@ -171,8 +188,9 @@ public class MusicInteractionHandler(IPlayerService playerService,
             switch (normalizedAction)
             {
                 case "options":
-                    string nowPlaying = (player.CurrentItem as CustomTrackQueueItem)?.Title ?? "Nothing";
-                    string artist = (player.CurrentItem as CustomTrackQueueItem)?.Artist ?? "";
+                    CustomTrackQueueItem? currentItem = player.CurrentItem as CustomTrackQueueItem;
+                    string nowPlaying = currentItem?.Title ?? "Nothing";
+                    string artist = currentItem?.Artist ?? "";
                     string displayNow = string.IsNullOrEmpty(artist) ? nowPlaying : $"{nowPlaying} - {artist}";
                     context.CustomData["currentPage"] = currentPage;
                     ComponentBuilder optionsComponents = buttonBuilder.BuildButtons(ButtonFlag.QueueOptions, context);
@@ -183,31 +201,19 @@ public class MusicInteractionHandler(IPlayerService playerService,
                     await ShowQueueAsync(player, currentPage);
                     break;
                 case "shuffle":
-                    int countBefore = player.Queue.Count;
-                    await player.Queue.ShuffleAsync();
-                    await interaction.ModifyOriginalResponseAsync(msg =>
-                    {
-                        msg.Components = ComponentV2Builder.Success("Queue Shuffled", $"Shuffled {countBefore} tracks.");
-                        msg.Embed = null;
-                        msg.Flags = MessageFlags.ComponentsV2;
-                    });
+                    int countBefore = await playerService.ShuffleQueueAsync(player);
+                    await UpdateQueuePanelAsync(ComponentV2Builder.Success("Queue Shuffled", $"Shuffled {countBefore} tracks."));
                     break;
                 case "clear":
-                    int cleared = player.Queue.Count;
-                    await player.Queue.ClearAsync();
-                    await interaction.ModifyOriginalResponseAsync(msg =>
-                    {
-                        msg.Components = ComponentV2Builder.Success("Queue Cleared", $"Removed {cleared} tracks from the queue.");
-                        msg.Embed = null;
-                        msg.Flags = MessageFlags.ComponentsV2;
-                    });
+                    int cleared = await playerService.ClearQueueAsync(player);
+                    await UpdateQueuePanelAsync(ComponentV2Builder.Success("Queue Cleared", $"Removed {cleared} tracks from the queue."));
                     break;
                 default:
                     MessageComponent unknownMsg = ComponentV2Builder.Error("Unknown Action", $"Unrecognized queue action: {action}");
                     if (isInitialOpen)
                         await FollowupAsync(components: unknownMsg, ephemeral: true);
                     else
-                        await interaction.ModifyOriginalResponseAsync(msg => { msg.Components = unknownMsg; msg.Embed = null; msg.Flags = MessageFlags.ComponentsV2; });
+                        await UpdateQueuePanelAsync(unknownMsg);
                     break;
             }
         }
@@ -220,12 +226,34 @@ public class MusicInteractionHandler(IPlayerService playerService,
                 if (isInitialOpen)
                     await FollowupAsync(components: errorMsg, ephemeral: true);
                 else
-                    await interaction.ModifyOriginalResponseAsync(msg => { msg.Components = errorMsg; msg.Embed = null; msg.Flags = MessageFlags.ComponentsV2; });
+                    await UpdateQueuePanelAsync(errorMsg);
             }
             catch { /* Ignore if the error response itself fails */ }
         }
     }
 
+    /// <summary>Replaces the contents of the queue panel the clicked button belongs to, answering the interaction with
+    /// the edit when it hasn't been answered yet and editing the original response otherwise</summary>
+    private async Task UpdateQueuePanelAsync(MessageComponent components)
+    {
+        if (!Context.Interaction.HasResponded && Context.Interaction is SocketMessageComponent component)
+        {
+            await component.UpdateAsync(msg =>
+            {
+                msg.Components = components;
+                msg.Embed = null;
+                msg.Flags = MessageFlags.ComponentsV2;
+            });
+            return;
+        }
+        await Context.Interaction.ModifyOriginalResponseAsync(msg =>
+        {
+            msg.Components = components;
+            msg.Embed = null;
+            msg.Flags = MessageFlags.ComponentsV2;
+        });
+    }
+
     /// <summary>Adjusts volume in 10% steps and triggers a Visual Player image rebuild
     /// to reflect the new volume level in the overlay bar</summary>
     [ComponentInteraction("volume:*")]
@@ -311,10 +339,7 @@ public class MusicInteractionHandler(IPlayerService playerService,
         }
         try
         {
-            if (Context.Guild is not null)
-                radioSessionManager.StopSession(Context.Guild.Id);
-
-            visualPlayer.StopProgressTimer();
+            // Progress timer and radio session are torn down by the player's shutdown path
             await playerService.StopAsync(Context.Interaction, true);
             Logs.Info($"Player killed by {Context.User.Username}");
         }
@@ -399,7 +424,7 @@ public class MusicInteractionHandler(IPlayerService playerService,
             }
 
             if (await playerService.GetPlayerAsync(Context.Interaction, false) is CustomLavaLinkPlayer player)
-                await player.Queue.ClearAsync();
+                await playerService.ClearQueueAsync(player);
 
             await playerService.AddToQueueAsync(Context.Interaction, tracks);
 
@@ -659,14 +684,14 @@ public class MusicInteractionHandler(IPlayerService playerService,
                 return;
             }
 
-            SearchResults searchResults = await plexMusicService.SearchLibraryAsync(modal.Destination);
-            if (searchResults.Tracks.Count == 0)
+            List<Track> destinationMatches = await plexMusicService.SearchTracksAsync(modal.Destination, 1);
+            if (destinationMatches.Count == 0)
             {
                 await FollowupAsync(components: ComponentV2Builder.Error("No Results", $"No tracks found for '{modal.Destination}'."), ephemeral: true);
                 return;
             }
 
-            Track endTrack = searchResults.Tracks.First();
+            Track endTrack = destinationMatches[0];
             string endRatingKey = PlexJsonParser.ExtractRatingKey(endTrack.SourceKey);
             if (string.IsNullOrEmpty(endRatingKey))
             {
@@ -821,10 +846,9 @@ public class MusicInteractionHandler(IPlayerService playerService,
         try
         {
             CustomTrackQueueItem? currentTrack = player.CurrentItem as CustomTrackQueueItem;
-            List<CustomTrackQueueItem?> queue = player.Queue.Select(item => item as CustomTrackQueueItem).ToList();
 
             const int itemsPerPage = 10;
-            int totalTracks = queue.Count;
+            int totalTracks = player.Queue.Count;
             int totalPages = Math.Max(1, (totalTracks + itemsPerPage - 1) / itemsPerPage);
             page = Math.Clamp(page, 1, totalPages);
 
@@ -832,16 +856,18 @@ public class MusicInteractionHandler(IPlayerService playerService,
                 ? $"**\u25B6\uFE0F Now Playing:** {currentTrack.Title} - {currentTrack.Artist} ({currentTrack.Duration})"
                 : null;
 
+            // Index straight into the visible page: Skip() on the queue would enumerate every earlier entry on
+            // each page click. Durations are pre-formatted on the track, so each line is a single append
             int startIndex = (page - 1) * itemsPerPage;
             int endIndex = Math.Min(startIndex + itemsPerPage, totalTracks);
             StringBuilder queueSb = new();
-            for (int i = startIndex; i < endIndex; i++)
+            for (int index = startIndex; index < endIndex; index++)
             {
-                CustomTrackQueueItem? item = queue[i];
-                if (item is not null)
-                    queueSb.AppendLine($"**#{i + 1}:** {item.Title} - {item.Artist} ({item.Duration})");
+                if (player.Queue[index] is not CustomTrackQueueItem item) continue;
+                if (queueSb.Length > 0) queueSb.Append('\n');
+                queueSb.Append($"**#{index + 1}:** {item.Title} - {item.Artist} ({item.Duration})");
             }
-            string queueText = queueSb.ToString().TrimEnd();
+            string queueText = queueSb.ToString();
 
             if (totalTracks == 0 && currentTrack is null)
                 queueText = "The queue is currently empty.";
@@ -857,45 +883,37 @@ public class MusicInteractionHandler(IPlayerService playerService,
                                    ButtonStyle.Secondary, disabled: page >= totalPages);
             }
 
-            await Context.Interaction.ModifyOriginalResponseAsync(msg =>
-            {
-                msg.Components = ComponentV2Builder.BuildQueueDisplay(
-                    nowPlayingLine, queueText, footerLine, components);
-                msg.Embed = null;
-                msg.Flags = MessageFlags.ComponentsV2;
-            });
+            await UpdateQueuePanelAsync(ComponentV2Builder.BuildQueueDisplay(
+                nowPlayingLine, queueText, footerLine, components));
         }
         catch (Exception ex)
         {
             Logs.Error($"Error showing queue: {ex.Message}");
             try
             {
-                await Context.Interaction.ModifyOriginalResponseAsync(msg =>
-                {
-                    msg.Components = ComponentV2Builder.Error("Queue Error", "An error occurred while showing the queue.");
-                    msg.Embed = null;
-                    msg.Flags = MessageFlags.ComponentsV2;
-                });
+                await UpdateQueuePanelAsync(ComponentV2Builder.Error("Queue Error", "An error occurred while showing the queue."));
             }
             catch { /* Ignore if the error response itself fails */ }
         }
     }
 
     /// <summary>Returns true if the user has interacted with this command within the cooldown window,
-    /// auto-pruning stale entries when the dictionary exceeds 100 items to prevent unbounded growth</summary>
+    /// auto-pruning stale entries (at most once a minute) when the dictionary exceeds 100 items to prevent unbounded growth</summary>
     public static bool IsOnCooldown(ulong userId, string commandId)
     {
         (ulong, string) key = (userId, commandId);
         DateTime now = DateTime.UtcNow;
 
-        if (_lastInteracted.Count > 100)
+        // ConcurrentDictionary.Count takes every bucket lock, so check the cheap prune interval first
+        long lastPrune = Interlocked.Read(ref _lastPruneTicks);
+        if (now.Ticks - lastPrune > TimeSpan.TicksPerMinute && _lastInteracted.Count > 100
+            && Interlocked.CompareExchange(ref _lastPruneTicks, now.Ticks, lastPrune) == lastPrune)
         {
-            foreach ((ulong, string) staleKey in _lastInteracted
-                .Where(kvp => now - kvp.Value > TimeSpan.FromMinutes(5))
-                .Select(kvp => kvp.Key)
-                .ToList())
+            // ConcurrentDictionary tolerates removal mid-enumeration, so no snapshot list is needed
+            foreach (KeyValuePair<(ulong, string), DateTime> entry in _lastInteracted)
             {
-                _lastInteracted.TryRemove(staleKey, out _);
+                if (now - entry.Value > TimeSpan.FromMinutes(5))
+                    _lastInteracted.TryRemove(entry);
             }
         }
 
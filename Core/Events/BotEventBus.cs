@@ -7,7 +7,9 @@ namespace PlexBot.Core.Events;
 /// Extensions can subscribe to events like track changes, player lifecycle, etc.</summary>
 public class BotEventBus
 {
-    private readonly ConcurrentDictionary<string, List<Func<BotEvent, Task>>> _handlers = new(StringComparer.OrdinalIgnoreCase);
+    // Handler arrays are copy-on-write: subscribe/unsubscribe swap in a new array under the lock,
+    // so publishing reads the current array without locking or snapshotting on every event
+    private readonly ConcurrentDictionary<string, Func<BotEvent, Task>[]> _handlers = new(StringComparer.OrdinalIgnoreCase);
     private readonly object _lock = new();
 
     /// <summary>Subscribe a handler to a specific event type</summary>
@@ -16,12 +18,9 @@ public class BotEventBus
         ArgumentNullException.ThrowIfNull(handler);
         lock (_lock)
         {
-            if (!_handlers.TryGetValue(eventType, out List<Func<BotEvent, Task>>? handlers))
-            {
-                handlers = [];
-                _handlers[eventType] = handlers;
-            }
-            handlers.Add(handler);
+            _handlers[eventType] = _handlers.TryGetValue(eventType, out Func<BotEvent, Task>[]? handlers)
+                ? [.. handlers, handler]
+                : [handler];
         }
         Logs.Debug($"Event bus: subscribed to '{eventType}'");
     }
@@ -31,24 +30,26 @@ public class BotEventBus
     {
         lock (_lock)
         {
-            if (_handlers.TryGetValue(eventType, out List<Func<BotEvent, Task>>? handlers))
+            if (_handlers.TryGetValue(eventType, out Func<BotEvent, Task>[]? handlers))
             {
-                handlers.Remove(handler);
+                int index = Array.IndexOf(handlers, handler);
+                if (index >= 0)
+                    _handlers[eventType] = [.. handlers[..index], .. handlers[(index + 1)..]];
             }
         }
     }
 
     /// <summary>Publish an event to all subscribers. Each handler is called sequentially
-    /// with individual try/catch so one failing handler doesn't block others.</summary>
+    /// with individual try/catch so one failing handler doesn't block others.
+    /// Handlers always run on the thread pool, never inline on the publisher's thread.</summary>
     public async Task PublishAsync(BotEvent botEvent)
     {
-        List<Func<BotEvent, Task>>? handlers;
-        lock (_lock)
-        {
-            if (!_handlers.TryGetValue(botEvent.EventType, out handlers) || handlers.Count == 0)
-                return;
-            handlers = [.. handlers]; // snapshot to avoid mutation during iteration
-        }
+        if (!_handlers.TryGetValue(botEvent.EventType, out Func<BotEvent, Task>[]? handlers) || handlers.Length == 0)
+            return;
+
+        // Track events are published fire-and-forget from Lavalink's event dispatch, but an async handler still runs
+        // synchronously up to its first await. Yield first so extension code can't stall playback events.
+        await Task.Yield();
 
         foreach (Func<BotEvent, Task> handler in handlers)
         {
@@ -56,7 +56,9 @@ public record PlayerOptions(ITextChannel? CurrentPlayerChannel) : QueuedLavalink
 /// <summary>Manages runtime state for the Visual Player across the application with thread-safe access</summary>
 public class VisualPlayerStateManager
 {
-    private readonly SemaphoreSlim _lock = new(1, 1);
+    // Plain monitor lock: these are tiny critical sections, so a synchronous SemaphoreSlim.Wait() only
+    // risked parking thread-pool threads under contention from the progress loop and interaction handlers
+    private readonly Lock _lock = new();
     private ITextChannel? _currentPlayerChannel;
     private IUserMessage? _currentPlayerMessage;
 
@@ -75,14 +77,14 @@ public class VisualPlayerStateManager
     /// <summary>Gets the current player channel in a thread-safe manner</summary>
     public ITextChannel? CurrentPlayerChannel
     {
-        get { _lock.Wait(); try { return _currentPlayerChannel; } finally { _lock.Release(); } }
-        set { _lock.Wait(); try { _currentPlayerChannel = value; } finally { _lock.Release(); } }
+        get { lock (_lock) { return _currentPlayerChannel; } }
+        set { lock (_lock) { _currentPlayerChannel = value; } }
     }
 
     /// <summary>Gets the current player message in a thread-safe manner</summary>
     public IUserMessage? CurrentPlayerMessage
     {
-        get { _lock.Wait(); try { return _currentPlayerMessage; } finally { _lock.Release(); } }
-        set { _lock.Wait(); try { _currentPlayerMessage = value; } finally { _lock.Release(); } }
+        get { lock (_lock) { return _currentPlayerMessage; } }
+        set { lock (_lock) { _currentPlayerMessage = value; } }
     }
 }
@@ -44,6 +44,31 @@ public interface IPlayerService
     /// <exception cref="PlayerException">Thrown when skipping fails due to player state issues or connection problems</exception>
     Task SkipTrackAsync(IDiscordInteraction interaction, CancellationToken cancellationToken = default);
 
+    /// <summary>Shuffles the upcoming tracks under the guild's queue lock so it can't interleave with a concurrent enqueue</summary>
+    /// <param name="player">The player whose queue should be shuffled</param>
+    /// <param name="cancellationToken">Optional token to cancel the operation</param>
+    /// <returns>The number of tracks that were shuffled</returns>
+    Task<int> ShuffleQueueAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default);
+
+    /// <summary>Removes every upcoming track under the guild's queue lock, leaving the current track playing</summary>
+    /// <param name="player">The player whose queue should be cleared</param>
+    /// <param name="cancellationToken">Optional token to cancel the operation</param>
+    /// <returns>The number of tracks that were removed</returns>
+    Task<int> ClearQueueAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default);
+
+    /// <summary>Stops playback and clears the queue together under the guild's queue lock so a concurrent enqueue can't slip in between</summary>
+    /// <param name="player">The player to stop</param>
+    /// <param name="cancellationToken">Optional token to cancel the operation</param>
+    /// <returns>A task that completes when playback has stopped and the queue is empty</returns>
+    Task StopAndClearAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default);
+
+    /// <summary>Removes an item from the front of the queue under the guild's queue lock, only if it is still the next item</summary>
+    /// <param name="player">The player whose queue should be changed</param>
+    /// <param name="item">The item expected at the head of the queue</param>
+    /// <param name="cancellationToken">Optional token to cancel the operation</param>
+    /// <returns>True if the item was still the head and was removed</returns>
+    Task<bool> RemoveQueueHeadAsync(QueuedLavalinkPlayer player, ITrackQueueItem item, CancellationToken cancellationToken = default);
+
     /// <summary>Configures how playback should continue when tracks end, supporting single-track loops, queue loops, or no repetition</summary>
     /// <param name="interaction">The Discord interaction containing guild context to identify the correct player</param>
     /// <param name="repeatMode">The desired repetition behavior that should be applied to current and future tracks</param>
@@ -21,7 +21,7 @@ public interface IPlexApiService
     /// <returns>A complete, authenticated URL ready for HTTP requests to search Plex content</returns>
     string GetSearchUrl(string path);
 
-    /// <summary>Builds a fully authenticated URL for artwork/thumbnail images from Plex</summary>
+    /// <summary>Builds a fully authenticated URL for artwork/thumbnail images from Plex, scaled down server-side by the photo transcoder</summary>
     /// <param name="artworkPath">The relative artwork path from Plex metadata (e.g., /library/metadata/123/thumb/456)</param>
     /// <returns>A complete, authenticated URL for the artwork image, or empty string if path is null/empty</returns>
     string GetArtworkUrl(string? artworkPath);
@@ -42,4 +42,9 @@ public interface IPlexApiService
     /// <param name="cancellationToken">Optional token to cancel the operation</param>
     /// <returns>The server's unique machine identifier string</returns>
     Task<string> GetMachineIdentifierAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>Auto-discovers the music library section ID, used to scope searches and filters to the music library</summary>
+    /// <param name="cancellationToken">Optional token to cancel the operation</param>
+    /// <returns>The section key of the first artist-type library on the server</returns>
+    Task<string> GetMusicSectionIdAsync(CancellationToken cancellationToken = default);
 }
@@ -13,6 +13,14 @@ public interface IPlexMusicService
     /// <exception cref="PlexApiException">Thrown when the Plex server returns an error or is unavailable during the search operation</exception>
     Task<SearchResults> SearchLibraryAsync(string query, CancellationToken cancellationToken = default);
 
+    /// <summary>Finds tracks whose title matches the query, filtered by type on the Plex server so only track metadata is returned</summary>
+    /// <param name="query">The title text to match</param>
+    /// <param name="limit">The maximum number of tracks to return</param>
+    /// <param name="cancellationToken">Optional token to cancel the search</param>
+    /// <returns>Matching tracks, then "Artist - Title" matches for queries in that form, falling back to the tracks from a full library search when neither matches</returns>
+    /// <exception cref="PlexApiException">Thrown when the Plex server returns an error or is unavailable during the search operation</exception>
+    Task<List<Track>> SearchTracksAsync(string query, int limit = 25, CancellationToken cancellationToken = default);
+
     /// <summary>Retrieves comprehensive track details needed for playback, including direct stream URLs, artwork, and extended metadata</summary>
     /// <param name="trackKey">The unique Plex identifier for the track, usually obtained from search results or other browsing operations</param>
     /// <param name="cancellationToken">Optional token to cancel the request if the user navigates away</param>
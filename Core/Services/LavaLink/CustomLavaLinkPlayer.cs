@@ -3,6 +3,7 @@ using Discord.WebSocket;
 using PlexBot.Core.Discord.Embeds;
 using PlexBot.Core.Events;
 using PlexBot.Core.Models.Players;
+using PlexBot.Core.Services.Music;
 
 namespace PlexBot.Core.Services.LavaLink;
 
@@ -12,6 +13,9 @@ namespace PlexBot.Core.Services.LavaLink;
 public sealed class CustomLavaLinkPlayer(IPlayerProperties<CustomLavaLinkPlayer, CustomPlayerOptions> properties,
     IServiceProvider serviceProvider) : QueuedLavalinkPlayer(properties), IInactivityPlayerListener
 {
+    // Player UI updates run off the Lavalink event dispatch, chained so they still apply in track order
+    private readonly object _visualUpdateLock = new();
+    private Task _visualUpdate = Task.CompletedTask;
 
     /// <inheritdoc />
     protected override async ValueTask NotifyTrackStartedAsync(ITrackQueueItem track, CancellationToken cancellationToken = default)
@@ -26,14 +30,22 @@ public sealed class CustomLavaLinkPlayer(IPlayerProperties<CustomLavaLinkPlayer,
                 Logs.Error("Track is not a CustomTrackQueueItem");
                 return;
             }
-            ButtonContext context = new() { Player = this };
-            ComponentBuilder components = buttonBuilder.BuildButtons(ButtonFlag.VisualPlayer, context);
-            await visualPlayer.AddOrUpdateVisualPlayerAsync(components, recreateImage: true).ConfigureAwait(false);
-
-            // Prefetch next track's artwork in background (fire and forget)
+            // Prefetch the next track (Lavalink resolve + artwork) in background before rendering the player,
+            // so the work overlaps the image build instead of starting after it (fire and forget)
             ITrackPrefetchService prefetch = serviceProvider.GetRequiredService<ITrackPrefetchService>();
             _ = prefetch.PrefetchNextAsync(this, cancellationToken);
 
+            // Rendering and uploading the player image takes hundreds of milliseconds; awaiting it here would hold
+            // up Lavalink's event processing for every player, so queue it behind any update still in progress
+            ButtonContext context = new() { Player = this };
+            ComponentBuilder components = buttonBuilder.BuildButtons(ButtonFlag.VisualPlayer, context);
+            lock (_visualUpdateLock)
+            {
+                _visualUpdate = _visualUpdate
+                    .ContinueWith(_ => visualPlayer.AddOrUpdateVisualPlayerAsync(components, recreateImage: true), TaskScheduler.Default)
+                    .Unwrap();
+            }
+
             // Publish track started event for extensions
             BotEventBus eventBus = serviceProvider.GetRequiredService<BotEventBus>();
             _ = eventBus.PublishAsync(new BotEvent
@@ -75,7 +87,9 @@ public sealed class CustomLavaLinkPlayer(IPlayerProperties<CustomLavaLinkPlayer,
                 {
                     ["title"] = trackTitle,
                     ["guildId"] = GuildId,
-                    ["endReason"] = endReason.ToString()
+                    ["endReason"] = endReason.ToString(),
+                    // Skips replace the track and queue advances start the next one before we get here
+                    ["hasNext"] = endReason == TrackEndReason.Replaced || State == PlayerState.Playing
                 }
             });
         }
@@ -101,8 +115,10 @@ public sealed class CustomLavaLinkPlayer(IPlayerProperties<CustomLavaLinkPlayer,
 
         try
         {
-            await StopAsync(cancellationToken).ConfigureAwait(false);
-            await DisconnectAsync(cancellationToken).ConfigureAwait(false);
+            // Go through the guild's queue lock so the timeout can't race an enqueue from a command
+            IPlayerService playerService = serviceProvider.GetRequiredService<IPlayerService>();
+            await playerService.StopAndClearAsync(this, cancellationToken).ConfigureAwait(false);
+            await ShutdownAsync(cancellationToken).ConfigureAwait(false);
         }
         catch (Exception ex)
         {
@@ -110,6 +126,22 @@ public sealed class CustomLavaLinkPlayer(IPlayerProperties<CustomLavaLinkPlayer,
         }
     }
 
+    /// <summary>Single teardown path shared by the kill button and the inactivity timeout: halts the progress timer,
+    /// ends any radio session, leaves voice and publishes the player destroyed event</summary>
+    public async ValueTask ShutdownAsync(CancellationToken cancellationToken = default)
+    {
+        serviceProvider.GetRequiredService<VisualPlayer>().StopProgressTimer();
+        serviceProvider.GetRequiredService<RadioSessionManager>().StopSession(GuildId);
+        await DisconnectAsync(cancellationToken).ConfigureAwait(false);
+
+        BotEventBus eventBus = serviceProvider.GetRequiredService<BotEventBus>();
+        _ = eventBus.PublishAsync(new BotEvent
+        {
+            EventType = BotEvents.PlayerDestroyed,
+            Data = new Dictionary<string, object> { ["guildId"] = GuildId }
+        });
+    }
+
     /// <summary>Called by Lavalink4NET inactivity tracking when player tracking state changes</summary>
     public ValueTask NotifyPlayerTrackedAsync(PlayerTrackingState trackingState, CancellationToken cancellationToken = default)
     {
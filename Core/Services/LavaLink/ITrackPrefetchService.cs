@@ -8,6 +8,12 @@ public interface ITrackPrefetchService
     /// <summary>Prefetches the next track in the queue. Safe to call multiple times — will not duplicate work.</summary>
     Task PrefetchNextAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default);
 
+    /// <summary>Resolves a deferred item at the head of the queue, removing any that can't be resolved so the queue never advances onto them.</summary>
+    Task ResolveNextAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default);
+
     /// <summary>Gets pre-downloaded artwork bytes if available, null otherwise.</summary>
     byte[]? GetCachedArtwork(string artworkUrl);
+
+    /// <summary>Gets artwork bytes from the cache, downloading and caching them on the shared artwork connection pool on a miss.</summary>
+    Task<byte[]> GetArtworkAsync(string artworkUrl, CancellationToken cancellationToken = default);
 }
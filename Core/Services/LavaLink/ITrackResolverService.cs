@@ -1,3 +1,4 @@
+using System.Diagnostics.CodeAnalysis;
 using PlexBot.Core.Models.Media;
 
 namespace PlexBot.Core.Services.LavaLink;
@@ -15,6 +16,12 @@ public interface ITrackResolverService
         int maxConcurrency = 5,
         IProgress<int>? progress = null,
         CancellationToken cancellationToken = default);
+
+    /// <summary>Stores a track that was already loaded from Lavalink so a later resolve of the same URL is a cache hit.</summary>
+    void CacheResolved(string playbackUrl, LavalinkTrack lavalinkTrack);
+
+    /// <summary>Looks up an already-resolved track for a playback URL without contacting Lavalink.</summary>
+    bool TryGetCached(string playbackUrl, [NotNullWhen(true)] out LavalinkTrack? lavalinkTrack);
 }
 
 /// <summary>Result of a parallel track resolution batch</summary>
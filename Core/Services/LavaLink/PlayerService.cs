@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using PlexBot.Core.Discord.Embeds;
 using PlexBot.Core.Exceptions;
 using PlexBot.Core.Models.Media;
@@ -13,6 +14,17 @@ namespace PlexBot.Core.Services.LavaLink;
 public class PlayerService(VisualPlayerStateManager stateManager, IAudioService audioService, VisualPlayer visualPlayer, IServiceProvider serviceProvider, DiscordButtonBuilder buttonBuilder, ITrackResolverService trackResolver)
     : IPlayerService
 {
+    // Per-guild locks serializing individual queue mutations, so concurrent enqueues can't both start playback and each
+    // bulk add lands as one contiguous run. The lock is released while a batch resolves, so the head and tail runs of
+    // two playlists added at the same time can still alternate in the queue.
+    private readonly ConcurrentDictionary<ulong, SemaphoreSlim> _queueLocks = new();
+
+    // How many unplayable tracks at the front of a batch are skipped before the whole add is reported as failed
+    private const int MaxLeadingSkips = 3;
+
+    // How long a skip waits for the next deferred item to resolve before letting Lavalink load it by identifier
+    private static readonly TimeSpan SkipResolveTimeout = TimeSpan.FromSeconds(3);
+
     /// <inheritdoc />
     public async Task<QueuedLavalinkPlayer?> GetPlayerAsync(IDiscordInteraction interaction, bool connectToVoiceChannel = true,
         CancellationToken cancellationToken = default)
@@ -31,7 +43,9 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
             // Determine channel behavior based on connectToVoiceChannel parameter
             PlayerChannelBehavior channelBehavior = connectToVoiceChannel ? PlayerChannelBehavior.Join : PlayerChannelBehavior.None;
             PlayerRetrieveOptions retrieveOptions = new(channelBehavior);
-            float defaultVolume = 0.2f;
+            // Any volume other than 100% makes Lavalink decode and re-encode the stream, even Opus sources
+            // it could otherwise pass straight through, so the starting level is left to configuration
+            float defaultVolume = Math.Clamp(BotConfig.GetInt("visualPlayer.defaultVolume", 20), 0, 100) / 100f;
             // Create player options
             CustomPlayerOptions playerOptions = new()
             {
@@ -93,8 +107,11 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
         }
         try
         {
-            IUserMessage response = await interaction.GetOriginalResponseAsync();
-            ITextChannel? channel = response.Channel as ITextChannel;
+            // The gateway interaction already carries its channel; only fall back to fetching the original
+            // response over REST when the channel isn't cached
+            ITextChannel? channel = interaction is SocketInteraction { Channel: ITextChannel socketChannel }
+                ? socketChannel
+                : (await interaction.GetOriginalResponseAsync()).Channel as ITextChannel;
             stateManager.CurrentPlayerChannel = channel ?? throw new InvalidOperationException("CurrentPlayerChannel is not set");
 
             List<Track> trackList = tracks.ToList();
@@ -104,8 +121,19 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
             if (totalCount == 0) return;
 
             // === STEP 1: Resolve and play the first track immediately ===
+            // An unavailable opening track shouldn't sink a whole playlist, so a few leading failures are
+            // skipped (and reported with the rest) until one resolves and playback can start
+            List<string> skippedTracks = [];
             Track firstTrack = trackList[0];
             LavalinkTrack? firstResolved = await trackResolver.ResolveTrackAsync(firstTrack, cancellationToken);
+            while (firstResolved == null && skippedTracks.Count < MaxLeadingSkips && trackList.Count > 1)
+            {
+                Logs.Warning($"Skipping unplayable track at the front of the batch: {firstTrack.Title}");
+                skippedTracks.Add(firstTrack.Title ?? "Unknown Track");
+                trackList.RemoveAt(0);
+                firstTrack = trackList[0];
+                firstResolved = await trackResolver.ResolveTrackAsync(firstTrack, cancellationToken);
+            }
 
             if (firstResolved == null)
             {
@@ -126,22 +154,20 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
                 Reference = new TrackReference(firstResolved)
             };
 
-            // Start playback if nothing is playing, otherwise add to queue
-            bool shouldPlay = player.State != PlayerState.Playing && player.State != PlayerState.Paused;
-            if (shouldPlay)
-            {
-                Logs.Debug($"Playing first track: {firstTrack.Title} by {firstTrack.Artist}");
-                await player.PlayAsync(firstItem, cancellationToken: cancellationToken);
-            }
-            else
-            {
-                await player.Queue.AddAsync(firstItem, cancellationToken);
-            }
+            SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+            bool startedPlayback = await PlayOrEnqueueAsync(player, queueLock, firstItem, cancellationToken);
 
             // === STEP 2: Resolve remaining tracks in parallel ===
-            if (totalCount > 1)
+            if (trackList.Count > 1 || skippedTracks.Count > 0)
             {
-                List<Track> remaining = trackList.Skip(1).ToList();
+                // Only the front of a large batch is resolved up-front; the tail is queued as identifier-only
+                // references that the prefetcher resolves while the previous track is still playing. Both
+                // slices are cut straight from trackList instead of copying the remainder and re-slicing it.
+                int eagerResolveLimit = BotConfig.GetInt("plex.eagerResolveLimit", 10);
+                int tailCount = trackList.Count - 1;
+                int eagerCount = eagerResolveLimit > 0 ? Math.Min(eagerResolveLimit, tailCount) : tailCount;
+                List<Track> remaining = trackList.GetRange(1, eagerCount);
+                List<Track> deferred = trackList.GetRange(1 + eagerCount, tailCount - eagerCount);
 
                 // Show progress for large playlists
                 if (totalCount > 10)
@@ -157,29 +183,23 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
 
                 // Progressive feedback for large playlists (throttled to avoid Discord rate limits)
                 IProgress<int>? progress = null;
+                int headResolved = 0;
                 if (totalCount > 20)
                 {
-                    DateTime lastProgressUpdate = DateTime.MinValue;
+                    long lastProgressTicks = 0;
                     int totalRemaining = remaining.Count;
+                    // Progress<T> posts callbacks to the thread pool, where several can run at once. The handler stays
+                    // synchronous and hands the edit to a task that handles its own failures
                     progress = new Progress<int>(resolvedCount =>
                     {
-                        // Throttle to at most once every 3 seconds
-                        if ((DateTime.UtcNow - lastProgressUpdate).TotalSeconds < 3) return;
-                        lastProgressUpdate = DateTime.UtcNow;
-                        _ = Task.Run(async () =>
-                        {
-                            try
-                            {
-                                await interaction.ModifyOriginalResponseAsync(msg =>
-                                {
-                                    msg.Components = ComponentV2Builder.Info("Loading Tracks",
-                                        $"Resolved {resolvedCount}/{totalRemaining} tracks...");
-                                    msg.Embed = null;
-                                    msg.Flags = MessageFlags.ComponentsV2;
-                                });
-                            }
-                            catch { /* Ignore update failures */ }
-                        });
+                        // Throttle to at most once every 3 seconds; the compare-exchange lets only one callback claim a window
+                        long now = DateTime.UtcNow.Ticks;
+                        long last = Interlocked.Read(ref lastProgressTicks);
+                        if (now - last < TimeSpan.TicksPerSecond * 3
+                            || Interlocked.CompareExchange(ref lastProgressTicks, now, last) != last)
+                            return;
+                        _ = ReportLoadingProgressAsync(interaction,
+                            $"Resolved {Volatile.Read(ref headResolved) + resolvedCount}/{totalRemaining} tracks...");
                     });
                 }
 
@@ -189,25 +209,35 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
                     ? BotConfig.GetInt("plex.maxConcurrentYouTubeResolves", 5)
                     : BotConfig.GetInt("plex.maxConcurrentResolves", 3);
 
-                TrackResolveResult resolveResult = await trackResolver.ResolveTracksParallelAsync(
-                    remaining,
+                // Resolve a small head first and queue it straight away, so Next Up and Skip work within
+                // one resolve round instead of waiting for the whole batch
+                int headCount = Math.Min(maxConcurrency, remaining.Count);
+                TrackResolveResult headResult = await trackResolver.ResolveTracksParallelAsync(
+                    remaining.GetRange(0, headCount),
                     maxConcurrency: maxConcurrency,
-                    progress: progress,
                     cancellationToken: cancellationToken);
+                List<ITrackQueueItem> headItems = BuildQueueItems(headResult, [], interaction.User.Username);
+                if (remaining.Count == headCount)
+                    headItems.AddRange(BuildQueueItems(null, deferred, interaction.User.Username));
+                await EnqueueRangeAsync(player, queueLock, headItems, cancellationToken);
+                Volatile.Write(ref headResolved, headResult.SuccessCount);
 
-                // Add all resolved tracks to queue in original order
-                foreach (var (index, track, resolved) in resolveResult.ResolvedTracks)
+                TrackResolveResult? tailResult = null;
+                if (remaining.Count > headCount)
                 {
-                    CustomTrackQueueItem item = new()
-                    {
-                        SourceTrack = track,
-                        RequestedBy = interaction.User.Username,
-                        Reference = new TrackReference(resolved)
-                    };
-                    await player.Queue.AddAsync(item, cancellationToken);
+                    tailResult = await trackResolver.ResolveTracksParallelAsync(
+                        remaining.GetRange(headCount, remaining.Count - headCount),
+                        maxConcurrency: maxConcurrency,
+                        progress: progress,
+                        cancellationToken: cancellationToken);
+                    await EnqueueRangeAsync(player, queueLock,
+                        BuildQueueItems(tailResult, deferred, interaction.User.Username), cancellationToken);
                 }
+                if (deferred.Count > 0)
+                    Logs.Debug($"Queued {deferred.Count} tracks for lazy resolution on play");
 
-                int totalSuccess = resolveResult.SuccessCount + 1; // +1 for the first track
+                List<string> failedTracks = [.. skippedTracks, .. headResult.FailedTracks, .. tailResult?.FailedTracks ?? []];
+                int totalSuccess = headResolved + (tailResult?.SuccessCount ?? 0) + deferred.Count + 1; // +1 for the first track
 
                 // Rebuild the player image now that the queue is fully populated (for Next Up display)
                 if (player is CustomLavaLinkPlayer customPlayerRefresh)
@@ -218,9 +248,9 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
                 }
 
                 // Final status message — include failed track names if any
-                if (resolveResult.FailedTracks.Count > 0)
+                if (failedTracks.Count > 0)
                 {
-                    string failedList = string.Join("\n", resolveResult.FailedTracks.Select(t => $"• {t}"));
+                    string failedList = string.Join("\n", failedTracks.Select(t => $"• {t}"));
                     string message = $"Added {totalSuccess} of {totalCount} tracks to the queue\n\n**Failed to load:**\n{failedList}";
                     await interaction.ModifyOriginalResponseAsync(msg =>
                     {
@@ -242,7 +272,7 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
             else
             {
                 // Single track — show appropriate message
-                string message = shouldPlay
+                string message = startedPlayback
                     ? $"Playing: {firstTrack.Title} by {firstTrack.Artist}"
                     : $"Added to queue: {firstTrack.Title} by {firstTrack.Artist}";
                 await interaction.ModifyOriginalResponseAsync(msg =>
@@ -319,14 +349,44 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
             Logs.Warning("Failed to get player for skip");
             throw new PlayerException("No active player found", "Skip");
         }
+        if (player.State != PlayerState.Playing && player.State != PlayerState.Paused)
+        {
+            throw new PlayerException("No track is currently playing", "Skip");
+        }
         try
         {
-            if (player.State != PlayerState.Playing && player.State != PlayerState.Paused)
+            // A skip can land before the background prefetch has resolved the next deferred item. Resolve the head
+            // outside the queue lock with a short cap so a slow or dead source can't block the guild; if the cap
+            // runs out the item still plays by identifier. In shuffle mode the head isn't what plays next, so skip it
+            if (!player.Shuffle)
             {
-                throw new PlayerException("No track is currently playing", "Skip");
+                using CancellationTokenSource resolveCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+                resolveCts.CancelAfter(SkipResolveTimeout);
+                try
+                {
+                    await serviceProvider.GetRequiredService<ITrackPrefetchService>().ResolveNextAsync(player, resolveCts.Token);
+                }
+                catch (OperationCanceledException) when (!cancellationToken.IsCancellationRequested)
+                {
+                    Logs.Debug("Next track didn't resolve in time for the skip, falling back to identifier playback");
+                }
+            }
+            // Check and skip under the queue lock so a concurrent play can't start a track in between
+            SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+            await queueLock.WaitAsync(cancellationToken);
+            try
+            {
+                if (player.State != PlayerState.Playing && player.State != PlayerState.Paused)
+                {
+                    throw new PlayerException("No track is currently playing", "Skip");
+                }
+                // Skip the current track — the player UI updates automatically via NotifyTrackStartedAsync
+                await player.SkipAsync(1, cancellationToken);
+            }
+            finally
+            {
+                queueLock.Release();
             }
-            // Skip the current track — the player UI updates automatically via NotifyTrackStartedAsync
-            await player.SkipAsync(1, cancellationToken);
             Logs.Debug($"Track skipped by {interaction.User.Username}");
         }
         catch (Exception ex) when (ex is not PlayerException)
@@ -336,6 +396,75 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
         }
     }
 
+    /// <inheritdoc />
+    public async Task<int> ShuffleQueueAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default)
+    {
+        SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            int count = player.Queue.Count;
+            await player.Queue.ShuffleAsync(cancellationToken);
+            return count;
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task<int> ClearQueueAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default)
+    {
+        SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            int count = player.Queue.Count;
+            await player.Queue.ClearAsync(cancellationToken);
+            return count;
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task StopAndClearAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default)
+    {
+        SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            await player.StopAsync(cancellationToken);
+            await player.Queue.ClearAsync(cancellationToken);
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task<bool> RemoveQueueHeadAsync(QueuedLavalinkPlayer player, ITrackQueueItem item,
+        CancellationToken cancellationToken = default)
+    {
+        SemaphoreSlim queueLock = GetQueueLock(player.GuildId);
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            // A shuffle, clear or skip may have moved on since the caller peeked
+            if (!player.Queue.TryPeek(out ITrackQueueItem? head) || !ReferenceEquals(head, item))
+                return false;
+            return await player.Queue.RemoveAsync(item, cancellationToken);
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
     /// <inheritdoc />
     public async Task SetRepeatModeAsync(IDiscordInteraction interaction, TrackRepeatMode repeatMode,
         CancellationToken cancellationToken = default)
@@ -389,14 +518,14 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
         }
         try
         {
-            // Stop playback
-            await player.StopAsync(cancellationToken);
-            // Clear the queue
-            await player.Queue.ClearAsync(cancellationToken);
+            await StopAndClearAsync(player, cancellationToken);
             // Disconnect if requested
             if (disconnect)
             {
-                await player.DisconnectAsync(cancellationToken);
+                if (player is CustomLavaLinkPlayer customPlayer)
+                    await customPlayer.ShutdownAsync(cancellationToken);
+                else
+                    await player.DisconnectAsync(cancellationToken);
                 Logs.Debug($"Player stopped and disconnected by {interaction.User.Username}");
             }
             else
@@ -410,4 +539,93 @@ public class PlayerService(VisualPlayerStateManager stateManager, IAudioService
             throw new PlayerException($"Failed to stop player: {ex.Message}", "Stop", ex);
         }
     }
+
+    /// <summary>Wraps resolved tracks (in original order) followed by deferred, identifier-only tracks as queue items</summary>
+    private static List<ITrackQueueItem> BuildQueueItems(TrackResolveResult? resolveResult, List<Track> deferred, string requestedBy)
+    {
+        List<ITrackQueueItem> queueItems = new((resolveResult?.ResolvedTracks.Count ?? 0) + deferred.Count);
+        if (resolveResult is not null)
+        {
+            foreach (var (_, track, resolved) in resolveResult.ResolvedTracks)
+            {
+                queueItems.Add(new CustomTrackQueueItem
+                {
+                    SourceTrack = track,
+                    RequestedBy = requestedBy,
+                    Reference = new TrackReference(resolved)
+                });
+            }
+        }
+        foreach (Track track in deferred)
+        {
+            queueItems.Add(new CustomTrackQueueItem
+            {
+                SourceTrack = track,
+                RequestedBy = requestedBy,
+                Reference = new TrackReference(track.PlaybackUrl)
+            });
+        }
+        return queueItems;
+    }
+
+    /// <summary>Edits the loading message with resolve progress. Failures are only logged, since a later edit replaces it</summary>
+    private static async Task ReportLoadingProgressAsync(IDiscordInteraction interaction, string message)
+    {
+        try
+        {
+            await interaction.ModifyOriginalResponseAsync(msg =>
+            {
+                msg.Components = ComponentV2Builder.Info("Loading Tracks", message);
+                msg.Embed = null;
+                msg.Flags = MessageFlags.ComponentsV2;
+            });
+        }
+        catch (Exception ex)
+        {
+            Logs.Debug($"Progress update skipped: {ex.Message}");
+        }
+    }
+
+    /// <summary>Starts playing the item if the player is idle, otherwise appends it to the queue. The check and the
+    /// action happen under the guild's queue lock so two concurrent requests can't both decide to start playback</summary>
+    /// <returns>True if playback was started, false if the item was queued</returns>
+    private static async Task<bool> PlayOrEnqueueAsync(QueuedLavalinkPlayer player, SemaphoreSlim queueLock,
+        CustomTrackQueueItem item, CancellationToken cancellationToken)
+    {
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            if (player.State is PlayerState.Playing or PlayerState.Paused)
+            {
+                await player.Queue.AddAsync(item, cancellationToken);
+                return false;
+            }
+            Logs.Debug($"Playing first track: {item.Title} by {item.Artist}");
+            await player.PlayAsync(item, cancellationToken: cancellationToken);
+            return true;
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
+    /// <summary>Appends queue items in a single bulk insert under the guild's queue lock</summary>
+    private static async Task EnqueueRangeAsync(QueuedLavalinkPlayer player, SemaphoreSlim queueLock,
+        List<ITrackQueueItem> queueItems, CancellationToken cancellationToken)
+    {
+        if (queueItems.Count == 0) return;
+        await queueLock.WaitAsync(cancellationToken);
+        try
+        {
+            await player.Queue.AddRangeAsync(queueItems, cancellationToken);
+        }
+        finally
+        {
+            queueLock.Release();
+        }
+    }
+
+    /// <summary>Gets the lock guarding queue mutations for a guild, creating it on first use</summary>
+    private SemaphoreSlim GetQueueLock(ulong guildId) => _queueLocks.GetOrAdd(guildId, _ => new SemaphoreSlim(1, 1));
 }
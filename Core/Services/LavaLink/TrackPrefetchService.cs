@@ -4,8 +4,12 @@ using PlexBot.Utils;
 namespace PlexBot.Core.Services.LavaLink;
 
 /// <summary>Pre-resolves upcoming tracks and caches artwork to reduce gaps between songs</summary>
-public class TrackPrefetchService(IHttpClientFactory httpClientFactory) : ITrackPrefetchService
+public class TrackPrefetchService(IHttpClientFactory httpClientFactory, ITrackResolverService trackResolver,
+    IServiceProvider serviceProvider) : ITrackPrefetchService
 {
+    // Long-lived client from the pooled "Artwork" handler so consecutive prefetches reuse the same connection
+    private readonly HttpClient _artworkClient = httpClientFactory.CreateClient("Artwork");
+
     // Artwork cache with LRU timestamps — keyed by URL
     private readonly ConcurrentDictionary<string, (byte[] Bytes, long Ticks)> _artworkCache = new();
     private const int MaxArtworkCacheEntries = 10;
@@ -18,10 +22,10 @@ public class TrackPrefetchService(IHttpClientFactory httpClientFactory) : ITrack
     {
         try
         {
-            // Peek at the next item in the queue
-            if (player.Queue.Count == 0) return;
-
-            ITrackQueueItem? nextItem = player.Queue.FirstOrDefault();
+            // Resolve the next deferred item while the current track plays so the transition doesn't wait on a
+            // Lavalink load, then peek at the head of the queue directly instead of enumerating it through LINQ
+            await ResolveNextAsync(player, cancellationToken);
+            if (!player.Queue.TryPeek(out ITrackQueueItem? nextItem)) return;
             if (nextItem is not CustomTrackQueueItem nextTrack) return;
 
             string? artworkUrl = nextTrack.Artwork;
@@ -36,20 +40,8 @@ public class TrackPrefetchService(IHttpClientFactory httpClientFactory) : ITrack
             // Pre-download artwork in background
             try
             {
-                using HttpClient client = httpClientFactory.CreateClient();
-                byte[] artworkBytes = await client.GetByteArrayAsync(artworkUrl, cancellationToken);
-
-                // Evict oldest entries (by LRU timestamp) if cache is full
-                while (_artworkCache.Count >= MaxArtworkCacheEntries)
-                {
-                    var oldest = _artworkCache.OrderBy(kvp => kvp.Value.Ticks).FirstOrDefault();
-                    if (oldest.Key != null)
-                        _artworkCache.TryRemove(oldest.Key, out _);
-                    else
-                        break;
-                }
-
-                _artworkCache[artworkUrl] = (artworkBytes, DateTime.UtcNow.Ticks);
+                byte[] artworkBytes = await _artworkClient.GetByteArrayAsync(artworkUrl, cancellationToken);
+                CacheArtwork(artworkUrl, artworkBytes);
                 Logs.Debug($"Prefetched artwork for: {nextTrack.Title} ({artworkBytes.Length} bytes)");
             }
             finally
@@ -68,6 +60,30 @@ public class TrackPrefetchService(IHttpClientFactory httpClientFactory) : ITrack
         }
     }
 
+    /// <inheritdoc />
+    public async Task ResolveNextAsync(QueuedLavalinkPlayer player, CancellationToken cancellationToken = default)
+    {
+        // Deferred queue items only carry an identifier. Resolving through the resolver keeps its YouTube search
+        // fallback, and an item that still can't be resolved is dropped rather than handed to Lavalink on advance
+        while (player.Queue.TryPeek(out ITrackQueueItem? nextItem)
+            && nextItem is CustomTrackQueueItem { Reference.Track: null } nextTrack
+            && !string.IsNullOrEmpty(nextTrack.SourceTrack.PlaybackUrl))
+        {
+            LavalinkTrack? resolved = await trackResolver.ResolveTrackAsync(nextTrack.SourceTrack, cancellationToken);
+            if (resolved != null)
+            {
+                nextTrack.Reference = new TrackReference(resolved);
+                Logs.Debug($"Prefetched track resolve for: {nextTrack.Title}");
+                return;
+            }
+            // Drop it through the player service so the removal takes the guild's queue lock like every other
+            // mutation (resolved lazily: the player service depends on this service through the visual player)
+            Logs.Warning($"Removing unplayable track from the queue: {nextTrack.Title}");
+            IPlayerService playerService = serviceProvider.GetRequiredService<IPlayerService>();
+            await playerService.RemoveQueueHeadAsync(player, nextTrack, cancellationToken);
+        }
+    }
+
     /// <inheritdoc />
     public byte[]? GetCachedArtwork(string artworkUrl)
     {
@@ -80,4 +96,30 @@ public class TrackPrefetchService(IHttpClientFactory httpClientFactory) : ITrack
         }
         return null;
     }
+
+    /// <inheritdoc />
+    public async Task<byte[]> GetArtworkAsync(string artworkUrl, CancellationToken cancellationToken = default)
+    {
+        byte[]? cached = GetCachedArtwork(artworkUrl);
+        if (cached != null) return cached;
+
+        byte[] artworkBytes = await _artworkClient.GetByteArrayAsync(artworkUrl, cancellationToken);
+        CacheArtwork(artworkUrl, artworkBytes);
+        return artworkBytes;
+    }
+
+    /// <summary>Stores artwork with an LRU timestamp, evicting the oldest entries if the cache is full</summary>
+    private void CacheArtwork(string artworkUrl, byte[] artworkBytes)
+    {
+        while (_artworkCache.Count >= MaxArtworkCacheEntries)
+        {
+            var oldest = _artworkCache.OrderBy(kvp => kvp.Value.Ticks).FirstOrDefault();
+            if (oldest.Key != null)
+                _artworkCache.TryRemove(oldest.Key, out _);
+            else
+                break;
+        }
+
+        _artworkCache[artworkUrl] = (artworkBytes, DateTime.UtcNow.Ticks);
+    }
 }
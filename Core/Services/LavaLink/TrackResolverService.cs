@@ -1,4 +1,6 @@
 using System.Collections.Concurrent;
+using System.Collections.Frozen;
+using System.Diagnostics.CodeAnalysis;
 using PlexBot.Core.Models.Media;
 using PlexBot.Utils;
 
@@ -7,47 +9,127 @@ namespace PlexBot.Core.Services.LavaLink;
 /// <summary>Resolves Track objects into Lavalink-playable LavalinkTrack references with support for parallel batch resolution</summary>
 public class TrackResolverService(IAudioService audioService) : ITrackResolverService
 {
-    // Cache resolved tracks by PlaybackUrl to avoid redundant Lavalink calls (replays, repeat mode)
+    // Cache resolved tracks by PlaybackUrl to avoid redundant Lavalink calls (replays, repeat mode).
+    // YouTube URLs are keyed by video ID so watch, short-link and timestamped forms share one entry.
     // Values are (LavalinkTrack, Ticks) for LRU eviction
     private readonly ConcurrentDictionary<string, (LavalinkTrack Track, long Ticks)> _resolveCache = new();
     private readonly int _maxResolveCacheEntries = BotConfig.GetInt("plex.resolveCacheSize", 500);
 
+    // Loads currently in flight, keyed like the resolve cache, so concurrent resolves of the same URL share one request
+    private readonly ConcurrentDictionary<string, Lazy<Task<LavalinkTrack?>>> _inflightResolves = new();
+
+    // The shared load can't follow any one caller's token, so it carries its own deadline
+    private static readonly TimeSpan SharedLoadTimeout = TimeSpan.FromSeconds(30);
+
+    // Load options never vary per track, so both are built once and shared by every resolve
+    private static readonly TrackLoadOptions DirectLoadOptions = new() { SearchMode = TrackSearchMode.None };
+    private static readonly TrackLoadOptions YouTubeSearchOptions = new() { SearchMode = TrackSearchMode.YouTube };
+
+    // Hosts whose /watch, /shorts, /embed and /live links identify a single YouTube video (youtu.be is handled separately)
+    private static readonly FrozenSet<string> YouTubeHosts = FrozenSet.ToFrozenSet(
+        ["youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"], StringComparer.OrdinalIgnoreCase);
+    private static readonly string[] YouTubeVideoPathPrefixes = ["/shorts/", "/embed/", "/live/"];
+
     /// <inheritdoc />
     public async Task<LavalinkTrack?> ResolveTrackAsync(Track track, CancellationToken cancellationToken = default)
     {
+        if (string.IsNullOrEmpty(track.PlaybackUrl))
+            return await LoadTrackAsync(track, cancellationToken);
+
         // Check cache first
-        if (!string.IsNullOrEmpty(track.PlaybackUrl) && _resolveCache.TryGetValue(track.PlaybackUrl, out var cached))
+        string cacheKey = GetCacheKey(track.PlaybackUrl);
+        if (_resolveCache.TryGetValue(cacheKey, out var cached))
         {
             // Update timestamp for LRU behavior
-            _resolveCache[track.PlaybackUrl] = (cached.Track, DateTime.UtcNow.Ticks);
+            _resolveCache[cacheKey] = (cached.Track, DateTime.UtcNow.Ticks);
             Logs.Debug($"Resolve cache hit: {track.Title}");
             return cached.Track;
         }
 
-        TrackLoadOptions loadOptions = new() { SearchMode = TrackSearchMode.None };
+        // Join an in-flight load for the same URL (e.g. two guilds queueing the same album) instead of
+        // sending a second identical request to Lavalink. The shared load ignores any single caller's
+        // token so one cancelled caller can't fail the others; each caller still honours its own token.
+        // The static factory takes its state as an argument, so joining an existing load allocates no closure.
+        // The load removes its own entry when it finishes, so a result is never replayed even if every waiter cancelled.
+        Lazy<Task<LavalinkTrack?>> load = _inflightResolves.GetOrAdd(cacheKey,
+            static (key, state) => new Lazy<Task<LavalinkTrack?>>(() => state.Resolver.LoadAndCacheAsync(state.Track, key)),
+            (Resolver: this, Track: track));
+        return await load.Value.WaitAsync(cancellationToken);
+    }
+
+    /// <inheritdoc />
+    public void CacheResolved(string playbackUrl, LavalinkTrack lavalinkTrack)
+    {
+        if (string.IsNullOrEmpty(playbackUrl)) return;
+        EvictOldestIfFull();
+        _resolveCache[GetCacheKey(playbackUrl)] = (lavalinkTrack, DateTime.UtcNow.Ticks);
+    }
+
+    /// <inheritdoc />
+    public bool TryGetCached(string playbackUrl, [NotNullWhen(true)] out LavalinkTrack? lavalinkTrack)
+    {
+        lavalinkTrack = null;
+        if (string.IsNullOrEmpty(playbackUrl)) return false;
+        string cacheKey = GetCacheKey(playbackUrl);
+        if (!_resolveCache.TryGetValue(cacheKey, out var cached)) return false;
+        _resolveCache[cacheKey] = (cached.Track, DateTime.UtcNow.Ticks);
+        lavalinkTrack = cached.Track;
+        return true;
+    }
+
+    /// <summary>Loads a track from Lavalink, stores it in the resolve cache on success, and always retires its
+    /// in-flight entry on completion so the next resolve of a failed URL starts a fresh load</summary>
+    private async Task<LavalinkTrack?> LoadAndCacheAsync(Track track, string cacheKey)
+    {
+        try
+        {
+            // One timer-backed token bounds the whole load; without it a hung Lavalink request would hold every
+            // caller joined to it. A timeout counts as a failed resolve so batch resolution retries it.
+            using CancellationTokenSource timeoutCts = new(SharedLoadTimeout);
+            LavalinkTrack? lavalinkTrack;
+            try
+            {
+                lavalinkTrack = await LoadTrackAsync(track, timeoutCts.Token);
+            }
+            catch (OperationCanceledException) when (timeoutCts.IsCancellationRequested)
+            {
+                Logs.Warning($"Timed out resolving track: {track.Title}");
+                return null;
+            }
+
+            // Cache the result with LRU timestamp before the in-flight entry goes away, so later callers hit the cache
+            if (lavalinkTrack != null)
+            {
+                EvictOldestIfFull();
+                _resolveCache[cacheKey] = (lavalinkTrack, DateTime.UtcNow.Ticks);
+            }
+
+            return lavalinkTrack;
+        }
+        finally
+        {
+            // The entry is only ever replaced after it's removed, so the one under this key is this load's own
+            _inflightResolves.TryRemove(cacheKey, out _);
+        }
+    }
 
+    /// <summary>Loads a track from Lavalink by its playback URL, falling back to search mode for YouTube sources</summary>
+    private async Task<LavalinkTrack?> LoadTrackAsync(Track track, CancellationToken cancellationToken)
+    {
         LavalinkTrack? lavalinkTrack = await audioService.Tracks.LoadTrackAsync(
             track.PlaybackUrl,
-            loadOptions,
+            DirectLoadOptions,
             cancellationToken: cancellationToken);
 
         // YouTube fallback: try search mode if direct URL fails
         if (lavalinkTrack == null && track.SourceSystem.Equals("youtube", StringComparison.OrdinalIgnoreCase))
         {
-            TrackLoadOptions searchOptions = new() { SearchMode = TrackSearchMode.YouTube };
             lavalinkTrack = await audioService.Tracks.LoadTrackAsync(
                 track.PlaybackUrl,
-                searchOptions,
+                YouTubeSearchOptions,
                 cancellationToken: cancellationToken);
         }
 
-        // Cache the result with LRU timestamp
-        if (lavalinkTrack != null && !string.IsNullOrEmpty(track.PlaybackUrl))
-        {
-            EvictOldestIfFull();
-            _resolveCache[track.PlaybackUrl] = (lavalinkTrack, DateTime.UtcNow.Ticks);
-        }
-
         return lavalinkTrack;
     }
 
@@ -62,15 +144,15 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
         ConcurrentDictionary<int, Track> failedIndexMap = new();
         ConcurrentDictionary<int, (Track Track, LavalinkTrack Resolved)> resolvedMap = new();
 
-        using SemaphoreSlim semaphore = new(maxConcurrency);
-
-        // First pass — resolve all tracks in parallel, collecting results by index
-        Task[] tasks = tracks.Select(async (Track track, int index) =>
+        // First pass — resolve all tracks in parallel, collecting results by index. ForEachAsync runs only
+        // maxConcurrency workers rather than starting a task per track that then waits on a semaphore
+        ParallelOptions parallelOptions = new() { MaxDegreeOfParallelism = maxConcurrency, CancellationToken = cancellationToken };
+        await Parallel.ForEachAsync(Enumerable.Range(0, tracks.Count), parallelOptions, async (int index, CancellationToken ct) =>
         {
-            await semaphore.WaitAsync(cancellationToken);
+            Track track = tracks[index];
             try
             {
-                LavalinkTrack? resolved = await ResolveTrackAsync(track, cancellationToken);
+                LavalinkTrack? resolved = await ResolveTrackAsync(track, ct);
                 if (resolved != null)
                 {
                     int count = Interlocked.Increment(ref successCount);
@@ -92,15 +174,10 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
                 Logs.Warning($"Error resolving track (will retry): {track.Title} — {ex.Message}");
                 failedIndexMap[index] = track;
             }
-            finally
-            {
-                semaphore.Release();
-            }
-        }).ToArray();
-
-        await Task.WhenAll(tasks);
+        });
 
-        // Retry pass — try failed tracks once more, sequentially with a small delay
+        // Retry pass — try failed tracks once more at half the concurrency, each worker pausing between attempts,
+        // so a large batch of failures isn't retried one round trip at a time
         List<string> permanentlyFailed = [];
 
         if (!failedIndexMap.IsEmpty)
@@ -108,11 +185,14 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
             Logs.Info($"Retrying {failedIndexMap.Count} failed tracks...");
             await Task.Delay(2000, cancellationToken);
 
-            foreach (var (index, track) in failedIndexMap.OrderBy(kvp => kvp.Key))
+            ConcurrentDictionary<int, string> permanentlyFailedMap = new();
+            ParallelOptions retryOptions = new() { MaxDegreeOfParallelism = Math.Max(1, maxConcurrency / 2), CancellationToken = cancellationToken };
+            await Parallel.ForEachAsync(failedIndexMap, retryOptions, async (KeyValuePair<int, Track> failed, CancellationToken ct) =>
             {
+                (int index, Track track) = (failed.Key, failed.Value);
                 try
                 {
-                    LavalinkTrack? resolved = await ResolveTrackAsync(track, cancellationToken);
+                    LavalinkTrack? resolved = await ResolveTrackAsync(track, ct);
                     if (resolved != null)
                     {
                         int count = Interlocked.Increment(ref successCount);
@@ -124,7 +204,7 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
                     {
                         string name = track.Title ?? "Unknown Track";
                         Logs.Error($"Failed to resolve track after retry: {name} — URL: {track.PlaybackUrl}");
-                        permanentlyFailed.Add(name);
+                        permanentlyFailedMap[index] = name;
                     }
                 }
                 catch (OperationCanceledException)
@@ -135,11 +215,14 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
                 {
                     string name = track.Title ?? "Unknown Track";
                     Logs.Error($"Error resolving track after retry: {name} — {ex.Message}");
-                    permanentlyFailed.Add(name);
+                    permanentlyFailedMap[index] = name;
                 }
 
-                await Task.Delay(500, cancellationToken);
-            }
+                await Task.Delay(500, ct);
+            });
+
+            // Report failures in playlist order regardless of which worker finished first
+            permanentlyFailed.AddRange(permanentlyFailedMap.OrderBy(kvp => kvp.Key).Select(kvp => kvp.Value));
         }
 
         // Build ordered list preserving original playlist order
@@ -151,16 +234,53 @@ public class TrackResolverService(IAudioService audioService) : ITrackResolverSe
         return new TrackResolveResult(successCount, permanentlyFailed, ordered);
     }
 
-    /// <summary>Evicts the oldest cache entry (by timestamp) when the cache is full</summary>
-    private void EvictOldestIfFull()
+    /// <summary>Returns the resolve cache key for a playback URL: "youtube:{videoId}" for YouTube video links,
+    /// otherwise the URL itself</summary>
+    private static string GetCacheKey(string playbackUrl)
     {
-        while (_resolveCache.Count >= _maxResolveCacheEntries)
+        if (!Uri.TryCreate(playbackUrl, UriKind.Absolute, out Uri? uri))
+            return playbackUrl;
+
+        // Exact host lookup, so look-alike domains that merely contain "youtube" are never treated as YouTube
+        string? videoId = null;
+        if (uri.Host.Equals("youtu.be", StringComparison.OrdinalIgnoreCase))
         {
-            var oldest = _resolveCache.OrderBy(kvp => kvp.Value.Ticks).FirstOrDefault();
-            if (oldest.Key != null)
-                _resolveCache.TryRemove(oldest.Key, out _);
+            videoId = uri.AbsolutePath.Trim('/');
+        }
+        else if (YouTubeHosts.Contains(uri.Host))
+        {
+            string path = uri.AbsolutePath;
+            if (path.Equals("/watch", StringComparison.OrdinalIgnoreCase))
+            {
+                videoId = HttpUtility.ParseQueryString(uri.Query)["v"];
+            }
             else
-                break;
+            {
+                foreach (string prefix in YouTubeVideoPathPrefixes)
+                {
+                    if (path.StartsWith(prefix, StringComparison.OrdinalIgnoreCase))
+                    {
+                        videoId = path[prefix.Length..].TrimEnd('/');
+                        break;
+                    }
+                }
+            }
+        }
+
+        return string.IsNullOrEmpty(videoId) ? playbackUrl : $"youtube:{videoId}";
+    }
+
+    /// <summary>Evicts the oldest ~10% of cache entries (by timestamp) when the cache is full</summary>
+    private void EvictOldestIfFull()
+    {
+        if (_resolveCache.Count < _maxResolveCacheEntries)
+            return;
+
+        // Trimming a batch at once means the full-cache sort runs once per batch of inserts instead of on every insert
+        int evictCount = Math.Max(1, _maxResolveCacheEntries / 10);
+        foreach (string key in _resolveCache.OrderBy(kvp => kvp.Value.Ticks).Take(evictCount).Select(kvp => kvp.Key))
+        {
+            _resolveCache.TryRemove(key, out _);
         }
     }
 }
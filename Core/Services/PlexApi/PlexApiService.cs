@@ -13,6 +13,11 @@ namespace PlexBot.Core.Services.PlexApi
         private readonly string _plexUrl;
         private string? _plexToken;
         private string? _machineIdentifier;
+        private string? _musicSectionId;
+        private readonly string _tokenQuery;
+
+        /// <summary>Edge length, in pixels, that Plex scales artwork down to before sending it</summary>
+        private const int ArtworkSize = 500;
 
         /// <summary>Configures the service with required dependencies and validates essential configuration settings</summary>
         /// <param name="httpClientFactory">HTTP client factory for creating named HTTP clients</param>
@@ -30,6 +35,8 @@ namespace PlexBot.Core.Services.PlexApi
             {
                 throw new ArgumentException("PLEX_TOKEN is not configured. Please set it in the .env file.");
             }
+            // Every parsed track gets a playback URL, so the token query is built once rather than per track
+            _tokenQuery = $"?X-Plex-Token={_plexToken}";
             Logs.Init($"PlexApiService initialized with server URL: {_plexUrl}");
         }
 
@@ -87,18 +94,17 @@ namespace PlexBot.Core.Services.PlexApi
                 throw new ArgumentException("Part key cannot be null or empty", nameof(partKey));
             }
             // If the partKey is already a full URL, just return it
-            if (partKey.StartsWith("http"))
+            if (partKey.StartsWith("http", StringComparison.Ordinal))
             {
                 return partKey;
             }
             // Fix duplicated "/children" if present (a common issue with some Plex servers)
-            string childrenSegment = "/children";
-            if (partKey.Contains(childrenSegment + childrenSegment))
+            if (partKey.Contains("/children/children", StringComparison.Ordinal))
             {
-                partKey = partKey.Replace(childrenSegment + childrenSegment, childrenSegment);
+                partKey = partKey.Replace("/children/children", "/children", StringComparison.Ordinal);
             }
             // Construct the URL with the token
-            return $"{_plexUrl}{partKey}?X-Plex-Token={_plexToken}";
+            return string.Concat(_plexUrl, partKey, _tokenQuery);
         }
 
         /// <inheritdoc />
@@ -109,11 +115,14 @@ namespace PlexBot.Core.Services.PlexApi
                 return "";
             }
             // If it's already a full URL, just return it
-            if (artworkPath.StartsWith("http"))
+            if (artworkPath.StartsWith("http", StringComparison.Ordinal))
             {
                 return artworkPath;
             }
-            return $"{_plexUrl}{artworkPath}?X-Plex-Token={_plexToken}";
+            // Let Plex scale the artwork server-side: originals can be several MB, while nothing we render
+            // or Discord displays is larger than ArtworkSize, so this saves both bandwidth and decode time
+            return $"{_plexUrl}/photo/:/transcode?width={ArtworkSize}&height={ArtworkSize}&minSize=1&upscale=0" +
+                $"&url={Uri.EscapeDataString(artworkPath)}&X-Plex-Token={_plexToken}";
         }
 
         /// <inheritdoc />
@@ -213,5 +222,42 @@ namespace PlexBot.Core.Services.PlexApi
                 throw new PlexApiException($"Failed to get machine identifier: {ex.Message}", ex);
             }
         }
+
+        /// <inheritdoc />
+        public async Task<string> GetMusicSectionIdAsync(CancellationToken cancellationToken = default)
+        {
+            if (!string.IsNullOrEmpty(_musicSectionId))
+                return _musicSectionId;
+
+            Logs.Debug("Discovering music library section ID");
+            try
+            {
+                string response = await PerformRequestAsync("/library/sections", cancellationToken);
+                JToken? mediaContainer = PlexJsonParser.ParseMediaContainer(response);
+                JToken? directories = mediaContainer?["Directory"];
+                if (directories is null)
+                    throw new PlexApiException("No library sections found on Plex server");
+
+                foreach (JToken dir in directories)
+                {
+                    string type = dir["type"]?.ToString() ?? "";
+                    if (type.Equals("artist", StringComparison.OrdinalIgnoreCase))
+                    {
+                        string sectionId = dir["key"]?.ToString() ?? "";
+                        if (!string.IsNullOrEmpty(sectionId))
+                        {
+                            Logs.Info($"Found music library section: {dir["title"]} (ID: {sectionId})");
+                            _musicSectionId = sectionId;
+                            return sectionId;
+                        }
+                    }
+                }
+                throw new PlexApiException("No music library section found on Plex server");
+            }
+            catch (Exception ex) when (ex is not PlexApiException)
+            {
+                throw new PlexApiException($"Failed to discover music section: {ex.Message}", ex);
+            }
+        }
     }
 }
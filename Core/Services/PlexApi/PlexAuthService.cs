@@ -176,31 +176,40 @@ public class PlexAuthService : IPlexAuthService
         string authUrl = ConstructAuthAppUrl(pinCode, "http://app.plex.tv");
         // In a real bot scenario, you would send this URL to the user and ask them to visit it
         Logs.Info($"Please authenticate at this URL: {authUrl}");
-        // Poll for authentication completion
+        // Poll for authentication completion on a single 5-second timer, bounded by a real 5-minute deadline
+        // rather than an attempt count that drifts by however long each check takes
         string? newAccessToken = null;
         int attempts = 0;
-        int maxAttempts = 60; // Poll for up to 5 minutes (60 attempts at 5-second intervals)
-        while (newAccessToken == null && attempts < maxAttempts)
+        using CancellationTokenSource deadlineCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        deadlineCts.CancelAfter(TimeSpan.FromMinutes(5));
+        using PeriodicTimer pollTimer = new(TimeSpan.FromSeconds(5));
+        try
         {
-            attempts++;
-            await Task.Delay(5000, cancellationToken); // Wait 5 seconds between checks
-            try
+            while (await pollTimer.WaitForNextTickAsync(deadlineCts.Token))
             {
-                newAccessToken = await CheckPinAsync(pinId, cancellationToken);
-            }
-            catch (Exception ex)
-            {
-                Logs.Warning($"Error checking PIN status (attempt {attempts}): {ex.Message}");
-            }
-            if (newAccessToken != null)
-            {
-                break;
-            }
-            if (attempts % 12 == 0) // Log every minute
-            {
-                Logs.Info($"Waiting for Plex authentication... ({attempts / 12} minutes elapsed)");
+                attempts++;
+                try
+                {
+                    newAccessToken = await CheckPinAsync(pinId, deadlineCts.Token);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    Logs.Warning($"Error checking PIN status (attempt {attempts}): {ex.Message}");
+                }
+                if (newAccessToken != null)
+                {
+                    break;
+                }
+                if (attempts % 12 == 0) // Log every minute
+                {
+                    Logs.Info($"Waiting for Plex authentication... ({attempts / 12} minutes elapsed)");
+                }
             }
         }
+        catch (OperationCanceledException) when (!cancellationToken.IsCancellationRequested)
+        {
+            // Deadline reached - reported as a timeout below
+        }
         if (newAccessToken == null)
         {
             throw new AuthenticationException("Plex authentication timed out. Please try again.", "PinCheck");
@@ -211,7 +220,7 @@ public class PlexAuthService : IPlexAuthService
         try
         {
             // Attempt to save the token to the .env file for persistence
-            SaveTokenToEnvFile(newAccessToken);
+            await SaveTokenToEnvFileAsync(newAccessToken, cancellationToken);
         }
         catch (Exception ex)
         {
@@ -223,14 +232,15 @@ public class PlexAuthService : IPlexAuthService
 
     /// <summary>Saves a Plex token to the .env file for persistence across restarts</summary>
     /// <param name="token">The token to save</param>
-    private void SaveTokenToEnvFile(string token)
+    /// <param name="cancellationToken">Optional token to cancel the file operations</param>
+    private static async Task SaveTokenToEnvFileAsync(string token, CancellationToken cancellationToken = default)
     {
         try
         {
             string envFilePath = System.IO.Path.Combine(AppDomain.CurrentDomain.BaseDirectory, ".env");
             if (File.Exists(envFilePath))
             {
-                string[] lines = File.ReadAllLines(envFilePath);
+                string[] lines = await File.ReadAllLinesAsync(envFilePath, cancellationToken);
                 bool tokenFound = false;
                 for (int i = 0; i < lines.Length; i++)
                 {
@@ -247,13 +257,13 @@ public class PlexAuthService : IPlexAuthService
                     Array.Resize(ref lines, lines.Length + 1);
                     lines[^1] = $"PLEX_TOKEN={token}";
                 }
-                File.WriteAllLines(envFilePath, lines);
+                await File.WriteAllLinesAsync(envFilePath, lines, cancellationToken);
                 Logs.Debug("Updated PLEX_TOKEN in .env file");
             }
             else
             {
                 // .env file doesn't exist, create it
-                File.WriteAllText(envFilePath, $"PLEX_TOKEN={token}\n");
+                await File.WriteAllTextAsync(envFilePath, $"PLEX_TOKEN={token}\n", cancellationToken);
                 Logs.Debug("Created .env file with PLEX_TOKEN");
             }
         }
@@ -17,24 +17,30 @@ public static class PlexJsonParser
     }
 
     /// <summary>Converts a single Plex metadata item into a Track, resolving playback URLs and formatting duration</summary>
-    public static Track ParseTrack(JToken item, IPlexApiService plexApiService)
+    public static Track ParseTrack(JToken item, IPlexApiService plexApiService) => ParseTrack(item, plexApiService, null);
+
+    /// <summary>Parses a track, reusing already-seen instances of repeated strings from the given pool when one is supplied</summary>
+    private static Track ParseTrack(JToken item, IPlexApiService plexApiService, HashSet<string>? sharedStrings)
     {
-        string partKey = item.SelectToken("Media[0].Part[0].key")?.ToString() ?? "";
+        // Direct indexing instead of SelectToken avoids compiling a JSONPath expression for every track
+        string partKey = item["Media"] is JArray { Count: > 0 } media && media[0]["Part"] is JArray { Count: > 0 } parts
+            ? parts[0]["key"]?.ToString() ?? ""
+            : "";
         string playableUrl = plexApiService.GetPlaybackUrl(partKey);
         long.TryParse(item["duration"]?.ToString(), out long duration);
         return new Track
         {
             Id = item["ratingKey"]?.ToString() ?? Guid.NewGuid().ToString(),
             Title = item["title"]?.ToString() ?? "Unknown Title",
-            Artist = item["grandparentTitle"]?.ToString() ?? "Unknown Artist",
-            Album = item["parentTitle"]?.ToString() ?? "Unknown Album",
-            ReleaseDate = item["originallyAvailableAt"]?.ToString() ?? "N/A",
-            ArtworkUrl = plexApiService.GetArtworkUrl(item["thumb"]?.ToString()),
+            Artist = Share(item["grandparentTitle"]?.ToString() ?? "Unknown Artist", sharedStrings),
+            Album = Share(item["parentTitle"]?.ToString() ?? "Unknown Album", sharedStrings),
+            ReleaseDate = Share(item["originallyAvailableAt"]?.ToString() ?? "N/A", sharedStrings),
+            ArtworkUrl = Share(plexApiService.GetArtworkUrl(item["thumb"]?.ToString()), sharedStrings),
             PlaybackUrl = playableUrl,
-            ArtistUrl = item["grandparentKey"]?.ToString() ?? "",
+            ArtistUrl = Share(item["grandparentKey"]?.ToString() ?? "", sharedStrings),
             DurationMs = duration,
             DurationDisplay = FormatHelper.FormatDuration(duration),
-            Studio = item["studio"]?.ToString() ?? "N/A",
+            Studio = Share(item["studio"]?.ToString() ?? "N/A", sharedStrings),
             SourceKey = item["key"]?.ToString() ?? "",
             SourceSystem = "plex"
         };
@@ -43,6 +49,7 @@ public static class PlexJsonParser
     /// <summary>Converts a Plex metadata item into an Album, extracting year from release date if not directly available</summary>
     public static Album ParseAlbum(JToken item, IPlexApiService plexApiService)
     {
+        string key = item["key"]?.ToString() ?? "";
         Album album = new()
         {
             Id = item["ratingKey"]?.ToString() ?? Guid.NewGuid().ToString(),
@@ -50,12 +57,12 @@ public static class PlexJsonParser
             Artist = item["parentTitle"]?.ToString() ?? "Unknown Artist",
             ReleaseDate = item["originallyAvailableAt"]?.ToString() ?? "N/A",
             ArtworkUrl = plexApiService.GetArtworkUrl(item["thumb"]?.ToString()),
-            AlbumUrl = item["key"]?.ToString() ?? "",
+            AlbumUrl = key,
             ArtistUrl = item["parentKey"]?.ToString() ?? "",
             Studio = item["studio"]?.ToString() ?? "N/A",
             Genre = GetGenresFromItem(item),
             Summary = item["summary"]?.ToString() ?? "",
-            SourceKey = item["key"]?.ToString() ?? "",
+            SourceKey = key,
             SourceSystem = "plex"
         };
         if (int.TryParse(item["year"]?.ToString(), out int year))
@@ -72,14 +79,15 @@ public static class PlexJsonParser
     /// <summary>Converts a Plex metadata item into an Artist with genre and artwork resolution</summary>
     public static Artist ParseArtist(JToken item, IPlexApiService plexApiService)
     {
+        string key = item["key"]?.ToString() ?? "";
         return new Artist
         {
             Id = item["ratingKey"]?.ToString() ?? Guid.NewGuid().ToString(),
             Name = item["title"]?.ToString() ?? "Unknown Artist",
             Summary = item["summary"]?.ToString() ?? "",
             ArtworkUrl = plexApiService.GetArtworkUrl(item["thumb"]?.ToString()),
-            ArtistUrl = item["key"]?.ToString() ?? "",
-            SourceKey = item["key"]?.ToString() ?? "",
+            ArtistUrl = key,
+            SourceKey = key,
             SourceSystem = "plex",
             Genre = GetGenresFromItem(item)
         };
@@ -88,31 +96,44 @@ public static class PlexJsonParser
     /// <summary>Converts a Plex metadata item into a Playlist, parsing track count and timestamps from Plex's custom fields</summary>
     public static Playlist ParsePlaylist(JToken item, IPlexApiService plexApiService)
     {
+        string key = item["key"]?.ToString() ?? "";
         Playlist playlist = new()
         {
             Id = item["ratingKey"]?.ToString() ?? Guid.NewGuid().ToString(),
             Title = item["title"]?.ToString() ?? "Unknown Playlist",
             Description = item["summary"]?.ToString() ?? "",
             ArtworkUrl = plexApiService.GetArtworkUrl(item["thumb"]?.ToString()),
-            PlaylistUrl = item["key"]?.ToString() ?? "",
-            SourceKey = item["key"]?.ToString() ?? "",
+            PlaylistUrl = key,
+            SourceKey = key,
             SourceSystem = "plex"
         };
         if (int.TryParse(item["leafCount"]?.ToString(), out int trackCount))
         {
             playlist.TrackCount = trackCount;
         }
-        if (DateTimeOffset.TryParse(item["createdAt"]?.ToString(), out DateTimeOffset createdAt))
+        if (TryParseTimestamp(item["createdAt"], out DateTimeOffset createdAt))
         {
             playlist.CreatedAt = createdAt;
         }
-        if (DateTimeOffset.TryParse(item["updatedAt"]?.ToString(), out DateTimeOffset updatedAt))
+        if (TryParseTimestamp(item["updatedAt"], out DateTimeOffset updatedAt))
         {
             playlist.UpdatedAt = updatedAt;
         }
         return playlist;
     }
 
+    /// <summary>Reads a Plex timestamp, which is sent as Unix epoch seconds, falling back to a date string</summary>
+    public static bool TryParseTimestamp(JToken? value, out DateTimeOffset timestamp)
+    {
+        string? text = value?.ToString();
+        if (long.TryParse(text, out long epochSeconds))
+        {
+            timestamp = DateTimeOffset.FromUnixTimeSeconds(epochSeconds);
+            return true;
+        }
+        return DateTimeOffset.TryParse(text, out timestamp);
+    }
+
     /// <summary>Joins the Genre tag array into a comma-separated display string, returning empty if none exist</summary>
     public static string GetGenresFromItem(JToken item)
     {
@@ -146,14 +167,25 @@ public static class PlexJsonParser
     public static List<Track> ParseTracksFromMetadata(JToken metadata, IPlexApiService plexApiService)
     {
         List<Track> tracks = [];
+        // Tracks from the same album repeat their artist/album/artwork strings; sharing one instance per value
+        // lets the duplicates be collected instead of being retained by every queued track
+        HashSet<string> sharedStrings = [];
         foreach (JToken item in metadata)
         {
             string type = item["type"]?.ToString() ?? "";
             if (type == "track")
             {
-                tracks.Add(ParseTrack(item, plexApiService));
+                tracks.Add(ParseTrack(item, plexApiService, sharedStrings));
             }
         }
         return tracks;
     }
+
+    private static string Share(string value, HashSet<string>? sharedStrings)
+    {
+        if (sharedStrings is null) return value;
+        if (sharedStrings.TryGetValue(value, out string? existing)) return existing;
+        sharedStrings.Add(value);
+        return value;
+    }
 }
@@ -12,14 +12,29 @@ namespace PlexBot.Core.Services.PlexApi;
 /// <param name="cache">Memory cache for reducing redundant Plex API calls</param>
 public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache) : IPlexMusicService
 {
-    private static readonly MemoryCacheEntryOptions SearchCacheOptions = new() { SlidingExpiration = TimeSpan.FromSeconds(60) };
     private static readonly MemoryCacheEntryOptions ListCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(2) };
-    private static readonly MemoryCacheEntryOptions PlaylistListCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(5) };
+    // Playlist contents are validated against the playlist list's updatedAt before reuse, so they can be kept far longer
+    private static readonly MemoryCacheEntryOptions PlaylistDetailsCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(30) };
+    // Absolute rather than sliding: playlist autocomplete reads this on every keystroke, which would otherwise keep
+    // the entry alive indefinitely and hide playlists created or edited directly in Plex
+    private static readonly MemoryCacheEntryOptions PlaylistListCacheOptions = new() { AbsoluteExpirationRelativeToNow = TimeSpan.FromMinutes(5) };
+    private const string PlaylistsCacheKey = "playlists:audio";
+    // Results requested per search hub (artists, albums, tracks, playlists), matching Discord's 25-option select menu
+    private const int SearchResultsPerType = 25;
+
+    // Absolute TTL so repeated searches are served locally without pinning stale results while they stay popular
+    private readonly MemoryCacheEntryOptions _searchCacheOptions = new()
+    {
+        AbsoluteExpirationRelativeToNow = TimeSpan.FromSeconds(Math.Max(1, BotConfig.GetInt("plex.searchCacheSeconds", 300)))
+    };
+
+    private readonly Lock _playlistsLoadLock = new();
+    private Task<List<Playlist>>? _playlistsLoad;
 
     /// <inheritdoc />
     public async Task<SearchResults> SearchLibraryAsync(string query, CancellationToken cancellationToken = default)
     {
-        string cacheKey = $"search:{query.ToLowerInvariant()}";
+        string cacheKey = $"search:{NormalizeQuery(query)}";
         if (cache.TryGetValue(cacheKey, out SearchResults? cached) && cached != null)
         {
             Logs.Debug($"Search cache hit for: {query}");
@@ -29,11 +44,23 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
         try
         {
             string encodedQuery = HttpUtility.UrlEncode(query);
-            string uri = $"/hubs/search?query={encodedQuery}&limit=100";
+            // Every consumer shows at most 25 results per type (the select menu limit) or just takes the
+            // first match, so don't have Plex build and serialize 100 per hub
+            string uri = $"/hubs/search?query={encodedQuery}&limit={SearchResultsPerType}";
+            // Scope the search to the music library so Plex doesn't also search movie/TV sections
+            try
+            {
+                string sectionId = await plexApiService.GetMusicSectionIdAsync(cancellationToken);
+                uri += $"&sectionId={sectionId}";
+            }
+            catch (PlexApiException ex)
+            {
+                Logs.Debug($"Searching all libraries, music section unavailable: {ex.Message}");
+            }
             string response = await plexApiService.PerformRequestAsync(uri, cancellationToken);
             SearchResults results = ParseSearchResults(response, query);
             Logs.Info($"Search complete. Found {results.Artists.Count} artists, {results.Albums.Count} albums, {results.Tracks.Count} tracks, {results.Playlists.Count} playlists");
-            cache.Set(cacheKey, results, SearchCacheOptions);
+            cache.Set(cacheKey, results, _searchCacheOptions);
 
             // Side-populate individual caches so subsequent detail fetches are hits
             foreach (Track track in results.Tracks)
@@ -61,6 +88,69 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
         }
     }
 
+    /// <inheritdoc />
+    public async Task<List<Track>> SearchTracksAsync(string query, int limit = SearchResultsPerType, CancellationToken cancellationToken = default)
+    {
+        string normalizedQuery = NormalizeQuery(query);
+        string cacheKey = $"search:tracks:{limit}:{normalizedQuery}";
+        if (cache.TryGetValue(cacheKey, out List<Track>? cached) && cached != null)
+            return cached;
+        // A full search for the same text already holds its track matches
+        if (cache.TryGetValue($"search:{normalizedQuery}", out SearchResults? fullResults) && fullResults != null
+            && fullResults.Tracks.Count > 0)
+            return [.. fullResults.Tracks.Take(limit)];
+
+        Logs.Info($"Searching Plex tracks for: {query}");
+        try
+        {
+            // Filter by type and title on the server instead of pulling every hub (artists, albums, playlists)
+            // when the caller only wants a track
+            string sectionId = await plexApiService.GetMusicSectionIdAsync(cancellationToken);
+            List<Track> tracks = await FetchTrackMatchesAsync(sectionId,
+                $"title={HttpUtility.UrlEncode(query)}", limit, cancellationToken);
+
+            // "Artist - Title" queries: match both fields on the server before paying for a full hub search
+            int separator = query.IndexOf(" - ", StringComparison.Ordinal);
+            if (tracks.Count == 0 && separator > 0 && separator < query.Length - 3)
+            {
+                string artist = query[..separator].Trim();
+                string title = query[(separator + 3)..].Trim();
+                tracks = await FetchTrackMatchesAsync(sectionId,
+                    $"artist.title={HttpUtility.UrlEncode(artist)}&title={HttpUtility.UrlEncode(title)}", limit, cancellationToken);
+            }
+
+            // Title-only matching misses artist and album names, which the full search also covers
+            if (tracks.Count == 0)
+            {
+                SearchResults results = await SearchLibraryAsync(query, cancellationToken);
+                tracks = [.. results.Tracks.Take(limit)];
+            }
+            cache.Set(cacheKey, tracks, _searchCacheOptions);
+            return tracks;
+        }
+        catch (Exception ex) when (ex is not PlexApiException)
+        {
+            Logs.Error($"Error searching Plex tracks: {ex.Message}");
+            throw new PlexApiException($"Failed to search Plex tracks: {ex.Message}", ex);
+        }
+    }
+
+    /// <summary>Lists tracks in the music section matching the given filter query string</summary>
+    private async Task<List<Track>> FetchTrackMatchesAsync(string sectionId, string filter, int limit, CancellationToken cancellationToken)
+    {
+        string uri = $"/library/sections/{sectionId}/all?type=10&{filter}&limit={limit}";
+        string response = await plexApiService.PerformRequestAsync(uri, cancellationToken);
+        JToken? metadataItems = PlexJsonParser.ParseMediaContainer(response)?["Metadata"];
+        return metadataItems != null
+            ? [.. PlexJsonParser.ParseTracksFromMetadata(metadataItems, plexApiService).Take(limit)]
+            : [];
+    }
+
+    /// <summary>Reduces a search query to its cache form: lower-cased words joined by single spaces, so queries that
+    /// differ only in case or spacing share one cached result instead of each costing a Plex round trip</summary>
+    private static string NormalizeQuery(string query) =>
+        string.Join(' ', query.Split(' ', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)).ToLowerInvariant();
+
     /// <inheritdoc />
     public async Task<Track?> GetTrackDetailsAsync(string trackKey, CancellationToken cancellationToken = default)
     {
@@ -184,12 +274,45 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
     /// <inheritdoc />
     public async Task<List<Playlist>> GetPlaylistsAsync(CancellationToken cancellationToken = default)
     {
-        const string cacheKey = "playlists:audio";
-        if (cache.TryGetValue(cacheKey, out List<Playlist>? cached) && cached != null)
+        if (cache.TryGetValue(PlaylistsCacheKey, out List<Playlist>? cached) && cached != null)
         {
             Logs.Debug("Playlists cache hit");
             return cached;
         }
+
+        // Playlist autocomplete fires on every keystroke, so share one in-flight fetch across cache misses. The fetch
+        // clears itself when it finishes, so a result is never replayed even if every waiter cancelled.
+        Task<List<Playlist>> load;
+        lock (_playlistsLoadLock)
+        {
+            if (_playlistsLoad == null)
+            {
+                load = FetchPlaylistsAsync(CancellationToken.None);
+                _playlistsLoad = load;
+                load.ContinueWith(ClearPlaylistsLoad, CancellationToken.None,
+                    TaskContinuationOptions.ExecuteSynchronously, TaskScheduler.Default);
+            }
+            else
+            {
+                load = _playlistsLoad;
+            }
+        }
+        return await load.WaitAsync(cancellationToken);
+    }
+
+    /// <summary>Retires a finished playlists fetch so the next cache miss starts a new one</summary>
+    private void ClearPlaylistsLoad(Task<List<Playlist>> finished)
+    {
+        lock (_playlistsLoadLock)
+        {
+            if (_playlistsLoad == finished)
+                _playlistsLoad = null;
+        }
+    }
+
+    /// <summary>Fetches audio playlists from Plex and stores them in the cache</summary>
+    private async Task<List<Playlist>> FetchPlaylistsAsync(CancellationToken cancellationToken)
+    {
         Logs.Debug("Getting audio playlists");
         try
         {
@@ -201,19 +324,18 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
                 Logs.Warning("MediaContainer is null in the playlists response");
                 return [];
             }
-            JToken? metadataItems = mediaContainer["Metadata"];
-            if (metadataItems == null)
-            {
-                Logs.Warning("No metadata items found in playlists response");
-                return [];
-            }
+            // Plex omits Metadata entirely when there are no audio playlists; cache that empty list too so
+            // autocomplete doesn't go back to the server on every keystroke
             List<Playlist> playlists = [];
-            foreach (JToken item in metadataItems)
+            if (mediaContainer["Metadata"] is JToken metadataItems)
             {
-                playlists.Add(PlexJsonParser.ParsePlaylist(item, plexApiService));
+                foreach (JToken item in metadataItems)
+                {
+                    playlists.Add(PlexJsonParser.ParsePlaylist(item, plexApiService));
+                }
             }
             Logs.Debug($"Retrieved {playlists.Count} playlists");
-            cache.Set(cacheKey, playlists, PlaylistListCacheOptions);
+            cache.Set(PlaylistsCacheKey, playlists, PlaylistListCacheOptions);
             return playlists;
         }
         catch (Exception ex) when (ex is not PlexApiException)
@@ -229,8 +351,12 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
         string cacheKey = $"playlist:{playlistKey}";
         if (cache.TryGetValue(cacheKey, out Playlist? cached) && cached != null)
         {
-            Logs.Debug($"Playlist details cache hit for: {playlistKey}");
-            return cached;
+            if (!await IsPlaylistChangedAsync(cached, cancellationToken))
+            {
+                Logs.Debug($"Playlist details cache hit for: {playlistKey}");
+                return cached;
+            }
+            Logs.Debug($"Cached playlist {playlistKey} changed in Plex, refetching");
         }
         Logs.Debug($"Getting playlist details: {playlistKey}");
         try
@@ -263,17 +389,32 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
             {
                 playlist.TrackCount = trackCount;
             }
-            if (DateTimeOffset.TryParse(mediaContainer["createdAt"]?.ToString(), out DateTimeOffset createdAt))
+            if (PlexJsonParser.TryParseTimestamp(mediaContainer["createdAt"], out DateTimeOffset createdAt))
             {
                 playlist.CreatedAt = createdAt;
             }
-            if (DateTimeOffset.TryParse(mediaContainer["updatedAt"]?.ToString(), out DateTimeOffset updatedAt))
+            if (PlexJsonParser.TryParseTimestamp(mediaContainer["updatedAt"], out DateTimeOffset updatedAt))
             {
                 playlist.UpdatedAt = updatedAt;
             }
             // Extract tracks from Metadata array
             playlist.Tracks = ParsePlaylistTracks(metadata);
-            cache.Set(cacheKey, playlist, ListCacheOptions);
+
+            // Change detection compares against the playlist list entry, and the items container may not carry
+            // updatedAt/leafCount at all, so stamp the cached copy with the list entry's values
+            try
+            {
+                if (await FindListedPlaylistAsync(playlistKey, cancellationToken) is Playlist listed)
+                {
+                    playlist.UpdatedAt = listed.UpdatedAt;
+                    playlist.TrackCount = listed.TrackCount;
+                }
+            }
+            catch (PlexApiException ex)
+            {
+                Logs.Debug($"Could not read playlist list entry for {playlistKey}: {ex.Message}");
+            }
+            cache.Set(cacheKey, playlist, PlaylistDetailsCacheOptions);
             Logs.Debug($"Retrieved playlist details: {playlist.Title} with {playlist.Tracks.Count} tracks");
             return playlist;
         }
@@ -284,6 +425,29 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
         }
     }
 
+    /// <summary>Compares a cached playlist with its entry in the (small, separately cached) playlist list, so a long-lived
+    /// copy of a large playlist is only refetched once Plex reports it was edited</summary>
+    private async Task<bool> IsPlaylistChangedAsync(Playlist cached, CancellationToken cancellationToken)
+    {
+        try
+        {
+            Playlist? listed = await FindListedPlaylistAsync(cached.SourceKey, cancellationToken);
+            return listed == null || listed.UpdatedAt != cached.UpdatedAt || listed.TrackCount != cached.TrackCount;
+        }
+        catch (PlexApiException ex)
+        {
+            Logs.Debug($"Could not check playlist for changes, using cached copy: {ex.Message}");
+            return false;
+        }
+    }
+
+    /// <summary>Finds a playlist's entry in the cached playlist list</summary>
+    private async Task<Playlist?> FindListedPlaylistAsync(string sourceKey, CancellationToken cancellationToken)
+    {
+        List<Playlist> playlists = await GetPlaylistsAsync(cancellationToken);
+        return playlists.Find(p => p.SourceKey == sourceKey);
+    }
+
     /// <summary>Parses tracks from playlist metadata</summary>
     private List<Track> ParsePlaylistTracks(JToken metadata)
         => PlexJsonParser.ParseTracksFromMetadata(metadata, plexApiService);
@@ -365,25 +529,35 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
     /// <inheritdoc />
     public async Task<List<Track>> GetAllArtistTracksAsync(string artistKey, CancellationToken cancellationToken = default)
     {
-        List<Album> albums = await GetAlbumsAsync(artistKey, cancellationToken);
-        if (albums.Count == 0) return [];
-
-        // Fetch tracks from each album in parallel with bounded concurrency
-        using SemaphoreSlim semaphore = new(4);
-        Task<List<Track>>[] tasks = albums.Select(async album =>
+        // A single allLeaves request returns every track under the artist, replacing one request per album
+        string ratingKey = PlexJsonParser.ExtractRatingKey(artistKey);
+        if (!string.IsNullOrEmpty(ratingKey))
         {
-            await semaphore.WaitAsync(cancellationToken);
             try
             {
-                return await GetTracksAsync(album.SourceKey, cancellationToken);
+                List<Track> leaves = await GetTracksAsync($"/library/metadata/{ratingKey}/allLeaves", cancellationToken);
+                if (leaves.Count > 0)
+                {
+                    Logs.Debug($"Retrieved {leaves.Count} total tracks for artist via allLeaves");
+                    return leaves;
+                }
             }
-            finally
+            catch (PlexApiException ex)
             {
-                semaphore.Release();
+                Logs.Debug($"allLeaves unavailable for artist, falling back to per-album fetch: {ex.Message}");
             }
-        }).ToArray();
+        }
 
-        List<Track>[] results = await Task.WhenAll(tasks);
+        List<Album> albums = await GetAlbumsAsync(artistKey, cancellationToken);
+        if (albums.Count == 0) return [];
+
+        // Fetch tracks from each album in parallel with bounded concurrency, keeping album order
+        List<Track>[] results = new List<Track>[albums.Count];
+        ParallelOptions parallelOptions = new() { MaxDegreeOfParallelism = 4, CancellationToken = cancellationToken };
+        await Parallel.ForEachAsync(Enumerable.Range(0, albums.Count), parallelOptions, async (int index, CancellationToken ct) =>
+        {
+            results[index] = await GetTracksAsync(albums[index].SourceKey, ct);
+        });
         List<Track> allTracks = results.SelectMany(tracks => tracks).ToList();
         Logs.Debug($"Retrieved {allTracks.Count} total tracks for artist from {albums.Count} albums");
         return allTracks;
@@ -413,12 +587,12 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
             {
                 Playlist playlist = PlexJsonParser.ParsePlaylist(metadata.First(), plexApiService);
                 Logs.Info($"Created Plex playlist: {playlist.Title} (ID: {playlist.Id})");
-                cache.Remove("playlists:audio");
+                cache.Remove(PlaylistsCacheKey);
                 return playlist;
             }
 
             // Fallback: some Plex versions return playlist info at MediaContainer level
-            cache.Remove("playlists:audio");
+            cache.Remove(PlaylistsCacheKey);
             return new Playlist
             {
                 Id = mediaContainer["ratingKey"]?.ToString() ?? Guid.NewGuid().ToString(),
@@ -451,7 +625,7 @@ public class PlexMusicService(IPlexApiService plexApiService, IMemoryCache cache
             await plexApiService.PerformPutRequestAsync(uri, cancellationToken);
 
             cache.Remove($"playlist:{playlistId}");
-            cache.Remove("playlists:audio");
+            cache.Remove(PlaylistsCacheKey);
 
             Logs.Info($"Successfully added {trackRatingKeys.Count} tracks to playlist {playlistId}");
             return true;
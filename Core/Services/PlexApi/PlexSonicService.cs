@@ -1,3 +1,4 @@
+using System.Runtime.InteropServices;
 using Microsoft.Extensions.Caching.Memory;
 using Newtonsoft.Json.Linq;
 using PlexBot.Core.Exceptions;
@@ -11,48 +12,13 @@ namespace PlexBot.Core.Services.PlexApi;
 /// genre/mood matching since no dedicated PMS endpoints exist for those.</summary>
 public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache) : IPlexSonicService
 {
-    private static readonly MemoryCacheEntryOptions PermanentCacheOptions = new() { AbsoluteExpiration = DateTimeOffset.MaxValue };
     private static readonly MemoryCacheEntryOptions TagCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(30) };
     private static readonly MemoryCacheEntryOptions TrackCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(5) };
     private static readonly MemoryCacheEntryOptions SimilarCacheOptions = new() { SlidingExpiration = TimeSpan.FromMinutes(10) };
 
     /// <inheritdoc />
-    public async Task<string> GetMusicSectionIdAsync(CancellationToken cancellationToken = default)
-    {
-        const string cacheKey = "plex:sectionId";
-        if (cache.TryGetValue(cacheKey, out string? cached) && !string.IsNullOrEmpty(cached))
-            return cached;
-
-        Logs.Debug("Discovering music library section ID");
-        try
-        {
-            string response = await plexApiService.PerformRequestAsync("/library/sections", cancellationToken);
-            JToken? mediaContainer = PlexJsonParser.ParseMediaContainer(response);
-            JToken? directories = mediaContainer?["Directory"];
-            if (directories is null)
-                throw new PlexApiException("No library sections found on Plex server");
-
-            foreach (JToken dir in directories)
-            {
-                string type = dir["type"]?.ToString() ?? "";
-                if (type.Equals("artist", StringComparison.OrdinalIgnoreCase))
-                {
-                    string sectionId = dir["key"]?.ToString() ?? "";
-                    if (!string.IsNullOrEmpty(sectionId))
-                    {
-                        Logs.Info($"Found music library section: {dir["title"]} (ID: {sectionId})");
-                        cache.Set(cacheKey, sectionId, PermanentCacheOptions);
-                        return sectionId;
-                    }
-                }
-            }
-            throw new PlexApiException("No music library section found on Plex server");
-        }
-        catch (Exception ex) when (ex is not PlexApiException)
-        {
-            throw new PlexApiException($"Failed to discover music section: {ex.Message}", ex);
-        }
-    }
+    public Task<string> GetMusicSectionIdAsync(CancellationToken cancellationToken = default)
+        => plexApiService.GetMusicSectionIdAsync(cancellationToken);
 
     /// <inheritdoc />
     public async Task<List<MoodTag>> GetAvailableMoodsAsync(CancellationToken cancellationToken = default)
@@ -202,10 +168,7 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
         Logs.Debug($"Building similar tracks for: {ratingKey}");
         try
         {
-            string metadataUri = $"/library/metadata/{ratingKey}";
-            string metadataResponse = await plexApiService.PerformRequestAsync(metadataUri, cancellationToken);
-            JToken? mediaContainer = PlexJsonParser.ParseMediaContainer(metadataResponse);
-            JToken? metadata = mediaContainer?["Metadata"]?.First;
+            JToken? metadata = await GetSeedMetadataAsync(ratingKey, cancellationToken);
 
             if (metadata is null)
             {
@@ -219,9 +182,11 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
             HashSet<string> seenKeys = [ratingKey];
             string sectionId = await GetMusicSectionIdAsync(cancellationToken);
 
-            // Pull tracks from matching genres (excluding the seed track itself)
+            // Pull tracks from matching genres (excluding the seed track itself). The genre pages are
+            // requested together and merged in tag order, so one round trip covers every genre.
             if (genreTags is not null)
             {
+                List<Task<List<Track>>> genreFetches = [];
                 foreach (JToken genreTag in genreTags)
                 {
                     string genreName = genreTag["tag"]?.ToString() ?? "";
@@ -229,9 +194,11 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
 
                     string uri = $"/library/sections/{sectionId}/all?type=10&genre={Uri.EscapeDataString(genreName)}&sort=random&limit={limit}";
                     Logs.Debug($"Fetching similar tracks via genre '{genreName}': {uri}");
-                    string response = await plexApiService.PerformRequestAsync(uri, cancellationToken);
-                    List<Track> genreTracks = ParseTracksFromResponse(response);
+                    genreFetches.Add(FetchTracksAsync(uri, cancellationToken));
+                }
 
+                foreach (List<Track> genreTracks in await Task.WhenAll(genreFetches))
+                {
                     foreach (Track track in genreTracks)
                     {
                         if (seenKeys.Contains(track.Id)) continue;
@@ -305,10 +272,7 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
         Logs.Debug($"Building radio tracks seeded from: {ratingKey}");
         try
         {
-            string metadataUri = $"/library/metadata/{ratingKey}";
-            string metadataResponse = await plexApiService.PerformRequestAsync(metadataUri, cancellationToken);
-            JToken? mediaContainer = PlexJsonParser.ParseMediaContainer(metadataResponse);
-            JToken? metadata = mediaContainer?["Metadata"]?.First;
+            JToken? metadata = await GetSeedMetadataAsync(ratingKey, cancellationToken);
 
             if (metadata is null)
             {
@@ -322,9 +286,11 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
             List<Track> radioTracks = [];
             HashSet<string> seenKeys = [ratingKey];
 
-            // Primary: pull from the seed track's genres (randomized)
+            // Primary: pull from the seed track's genres (randomized). The genre pages are independent,
+            // so they are requested together and merged in tag order once all have returned.
             if (genreTags is not null)
             {
+                List<Task<List<Track>>> genreFetches = [];
                 foreach (JToken genreTag in genreTags)
                 {
                     string genreName = genreTag["tag"]?.ToString() ?? "";
@@ -332,16 +298,16 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
 
                     string uri = $"/library/sections/{sectionId}/all?type=10&genre={Uri.EscapeDataString(genreName)}&sort=random&limit={limit}";
                     Logs.Debug($"Radio: fetching genre '{genreName}' tracks");
-                    string response = await plexApiService.PerformRequestAsync(uri, cancellationToken);
-                    List<Track> genreTracks = ParseTracksFromResponse(response);
+                    genreFetches.Add(FetchTracksAsync(uri, cancellationToken));
+                }
 
+                foreach (List<Track> genreTracks in await Task.WhenAll(genreFetches))
+                {
                     foreach (Track track in genreTracks)
                     {
-                        if (seenKeys.Contains(track.Id)) continue;
-                        seenKeys.Add(track.Id);
-                        radioTracks.Add(track);
+                        if (seenKeys.Add(track.Id))
+                            radioTracks.Add(track);
                     }
-                    if (radioTracks.Count >= limit) break;
                 }
             }
 
@@ -368,11 +334,10 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
                 }
             }
 
-            // Shuffle to avoid genre-clustered ordering
-            Random rng = new();
-            radioTracks = [.. radioTracks.OrderBy(_ => rng.Next())];
+            // Shuffle to avoid genre-clustered ordering (in place, then trim the overflow off the end)
+            Random.Shared.Shuffle(CollectionsMarshal.AsSpan(radioTracks));
             if (radioTracks.Count > limit)
-                radioTracks = radioTracks.Take(limit).ToList();
+                radioTracks.RemoveRange(limit, radioTracks.Count - limit);
 
             Logs.Info($"Radio generated {radioTracks.Count} tracks from seed {ratingKey}");
             return radioTracks;
@@ -474,4 +439,25 @@ public class PlexSonicService(IPlexApiService plexApiService, IMemoryCache cache
         if (metadata is null) return [];
         return PlexJsonParser.ParseTracksFromMetadata(metadata, plexApiService);
     }
+
+    /// <summary>Fetches a seed track's metadata (genre/mood tags, artist key), cached so similar-tracks,
+    /// radio and radio refills seeded from the same track don't each re-request it</summary>
+    private async Task<JToken?> GetSeedMetadataAsync(string ratingKey, CancellationToken cancellationToken)
+    {
+        string cacheKey = $"seed:{ratingKey}";
+        if (cache.TryGetValue(cacheKey, out JToken? cached) && cached is not null)
+            return cached;
+
+        string metadataResponse = await plexApiService.PerformRequestAsync($"/library/metadata/{ratingKey}", cancellationToken);
+        JToken? metadata = PlexJsonParser.ParseMediaContainer(metadataResponse)?["Metadata"]?.First;
+        if (metadata is not null)
+            cache.Set(cacheKey, metadata, TrackCacheOptions);
+        return metadata;
+    }
+
+    private async Task<List<Track>> FetchTracksAsync(string uri, CancellationToken cancellationToken)
+    {
+        string response = await plexApiService.PerformRequestAsync(uri, cancellationToken);
+        return ParseTracksFromResponse(response);
+    }
 }
@@ -2,6 +2,7 @@ using PlexBot.Core.Discord.Embeds;
 using PlexBot.Core.Discord.Events;
 using PlexBot.Core.Extensions;
 using PlexBot.Core.Models.Players;
+using PlexBot.Core.Services;
 using PlexBot.Core.Services.Music;
 using PlexBot.Utils;
 using PlexBot.Utils.Http;
@@ -37,6 +38,8 @@ public class BotHostedService(DiscordSocketClient client, DiscordEventHandler ev
             IAudioService lavalinkNode = serviceProvider.GetRequiredService<IAudioService>();
             await lavalinkNode.StartAsync(cancellationToken);
             Logs.Init("Lavalink services initialized");
+            // Discover the Plex music section up-front so the first search/filter doesn't pay for it
+            _ = WarmPlexMusicSectionAsync();
             // Initialize extensions (Phase 2 of two-phase startup — services already registered)
             int extensionsLoaded = await extensionManager.InitializeAllAsync(serviceProvider);
             Logs.Info($"Initialized {extensionsLoaded} extensions");
@@ -47,12 +50,14 @@ public class BotHostedService(DiscordSocketClient client, DiscordEventHandler ev
                 providerRegistry.RegisterProvider(provider);
             }
             Logs.Init($"Registered {providerRegistry.GetAvailableProviders().Count} music providers");
+            // The static player channel can only be looked up once the guild cache is filled, so it is set up
+            // when the client first reports Ready instead of after a fixed delay that holds up startup
+            client.Ready += OnFirstReadyAsync;
             // Connect to Discord and start the bot
             Logs.Init("Connecting to Discord");
             await client.LoginAsync(TokenType.Bot, _discordToken);
             await client.StartAsync();
             Logs.Init("Bot service started");
-            await InitializeStaticPlayerChannelAsync();
         }
         catch (Exception ex)
         {
@@ -61,6 +66,29 @@ public class BotHostedService(DiscordSocketClient client, DiscordEventHandler ev
         }
     }
 
+    /// <summary>Looks up and caches the Plex music library section in the background</summary>
+    private async Task WarmPlexMusicSectionAsync()
+    {
+        try
+        {
+            IPlexApiService plexApiService = serviceProvider.GetRequiredService<IPlexApiService>();
+            await plexApiService.GetMusicSectionIdAsync();
+        }
+        catch (Exception ex)
+        {
+            Logs.Warning($"Could not discover Plex music section at startup: {ex.Message}");
+        }
+    }
+
+    /// <summary>Runs the one-time static player setup on the first Ready event; later Ready events (reconnects) are ignored</summary>
+    private Task OnFirstReadyAsync()
+    {
+        client.Ready -= OnFirstReadyAsync;
+        // Ready handlers run inline on the gateway, so the channel cleanup continues in the background
+        _ = InitializeStaticPlayerChannelAsync();
+        return Task.CompletedTask;
+    }
+
     /// <summary>Initializes the static player channel if enabled in configuration</summary>
     /// <returns>A task representing the initialization operation</returns>
     private async Task InitializeStaticPlayerChannelAsync()
@@ -76,8 +104,6 @@ public class BotHostedService(DiscordSocketClient client, DiscordEventHandler ev
         {
             ulong staticChannelId = stateManager.StaticChannelId.Value;
             Logs.Init($"Initializing static player channel ({staticChannelId})...");
-            // Wait a moment for the client to be fully ready
-            await Task.Delay(2000);
             // Get the channel from the client
             if (client.GetChannel(staticChannelId) is not ITextChannel textChannel)
             {
@@ -95,6 +121,26 @@ public class BotHostedService(DiscordSocketClient client, DiscordEventHandler ev
             Logs.Info("Cleaning up static player channel...");
             var messages = await textChannel.GetMessagesAsync(50).FlattenAsync();
             List<IMessage> botMessages = messages.Where(m => m.Author.Id == client.CurrentUser.Id).ToList();
+            // Bulk delete removes up to 100 messages younger than 14 days in one request (needs Manage Messages);
+            // anything older, or a single leftover, falls through to one-by-one deletion
+            if (permissions.ManageMessages)
+            {
+                DateTimeOffset bulkCutoff = DateTimeOffset.UtcNow.AddDays(-14).AddMinutes(5);
+                List<IMessage> recent = botMessages.Where(m => m.Timestamp > bulkCutoff).ToList();
+                if (recent.Count >= 2)
+                {
+                    try
+                    {
+                        await textChannel.DeleteMessagesAsync(recent);
+                        botMessages = botMessages.Except(recent).ToList();
+                        Logs.Debug($"Bulk deleted {recent.Count} old player messages");
+                    }
+                    catch (Exception ex)
+                    {
+                        Logs.Warning($"Bulk delete failed, deleting individually: {ex.Message}");
+                    }
+                }
+            }
             foreach (IMessage message in botMessages)
             {
                 try
@@ -56,8 +56,9 @@ public class PlexBotMain
         {
             // Ensure logs are saved and resources are cleaned up
             Logs.Info("Shutting down");
-            // Wait a moment for logs to flush
-            await Task.Delay(1000);
+            // Wake the log saver for its final flush and wait only as long as that takes, rather than a fixed
+            // delay that neither guarantees the flush nor returns early once it's done
+            Logs.StopLogSaving();
         }
     }
 
@@ -55,14 +55,14 @@ namespace PlexBot.Main
             // which handles console filtering (LOGGING_LEVEL_ROOT) and always saves everything to file
             services.AddSingleton(new DiscordSocketClient(new DiscordSocketConfig
             {
+                // Everything is driven by interactions, which need no intents; only guild and voice state
+                // events are required (voice channel lookup and Lavalink voice connections)
                 GatewayIntents = GatewayIntents.Guilds
-                    | GatewayIntents.GuildMessages
-                    | GatewayIntents.GuildVoiceStates
-                    | GatewayIntents.GuildMessageReactions
-                    | GatewayIntents.DirectMessages
-                    | GatewayIntents.MessageContent,
+                    | GatewayIntents.GuildVoiceStates,
                 AlwaysDownloadUsers = false,
-                MessageCacheSize = 100,
+                // Nothing reads the socket message cache: component interactions carry their own message and
+                // the player message is held by VisualPlayerStateManager, so skip caching every message we see
+                MessageCacheSize = 0,
                 LogLevel = LogSeverity.Debug,
                 // Use Discord's server time instead of the system clock for rate limit
                 // calculations. Prevents clock skew in Docker from causing mismatches.
@@ -90,11 +90,30 @@ namespace PlexBot.Main
         private static void AddPlexServices(IServiceCollection services)
         {
             // Add Plex HTTP client
+            // PlexApiService holds its client for the bot's lifetime, so give it a pooled handler whose
+            // connections outlive the gap between tracks instead of the default one-minute idle timeout
             services.AddHttpClient("PlexApi", client =>
             {
                 client.DefaultRequestHeaders.Add("Accept", "application/json");
                 client.Timeout = TimeSpan.FromSeconds(30);
-            });
+            }).ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+            {
+                PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+                PooledConnectionIdleTimeout = TimeSpan.FromMinutes(5),
+                MaxConnectionsPerServer = 8
+            }).SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
+            // Artwork client keeps its connections alive between prefetches so album queues
+            // don't pay a fresh TCP/TLS handshake to the Plex server for every thumbnail
+            services.AddHttpClient("Artwork", client =>
+            {
+                client.Timeout = TimeSpan.FromSeconds(15);
+            }).ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+            {
+                PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+                PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+                MaxConnectionsPerServer = 4
+            }).SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 
             // Add Plex services
             services.AddSingleton<IPlexAuthService, PlexAuthService>();
@@ -137,7 +156,7 @@ namespace PlexBot.Main
 
             // Register options
             services.Configure<PlayerOptions>(options => {
-                options.DefaultVolume = 0.2f;
+                options.DefaultVolume = Math.Clamp(BotConfig.GetInt("visualPlayer.defaultVolume", 20), 0, 100) / 100f;
                 options.DisconnectAfterPlayback = false;
                 options.InactivityTimeout = TimeSpan.FromMinutes(20);
                 options.AnnounceNowPlaying = true;
@@ -13,8 +13,9 @@ public static class FormatHelper
     /// <summary>Formats a TimeSpan as a human-readable string like "3:45" or "1:23:45"</summary>
     public static string FormatDuration(TimeSpan duration)
     {
-        return duration.TotalHours >= 1
-            ? $"{(int)duration.TotalHours}:{duration.Minutes:D2}:{duration.Seconds:D2}"
+        // Integer components only: TotalHours would round-trip through a double on every call
+        return duration.Ticks >= TimeSpan.TicksPerHour
+            ? $"{duration.Days * 24 + duration.Hours}:{duration.Minutes:D2}:{duration.Seconds:D2}"
             : $"{duration.Minutes:D2}:{duration.Seconds:D2}";
     }
 }
@@ -29,6 +29,9 @@ public class HttpClientWrapper(HttpClient httpClient, string serviceName, int ma
     private readonly int _maxRetries = maxRetries;
     private readonly TimeSpan _retryDelay = TimeSpan.FromSeconds(retryDelaySec);
 
+    // Shared across all calls so System.Text.Json builds its per-type metadata cache once instead of per response
+    private static readonly JsonSerializerOptions _jsonOptions = new() { PropertyNameCaseInsensitive = true };
+
     /// <summary>Sends a GET request to the specified URI with retry logic.
     /// Handles the complete request lifecycle including retries on transient errors
     /// and consistent error handling for different failure scenarios.</summary>
@@ -168,10 +171,7 @@ public class HttpClientWrapper(HttpClient httpClient, string serviceName, int ma
                 // For success responses, try to deserialize
                 try
                 {
-                    T result = System.Text.Json.JsonSerializer.Deserialize<T>(responseBody, new JsonSerializerOptions
-                    {
-                        PropertyNameCaseInsensitive = true
-                    }) ?? throw new InvalidOperationException("Deserialization returned null");
+                    T result = System.Text.Json.JsonSerializer.Deserialize<T>(responseBody, _jsonOptions) ?? throw new InvalidOperationException("Deserialization returned null");
                     Logs.Debug($"[{_serviceName}] Request successful");
                     return result;
                 }
@@ -415,10 +415,7 @@ public class HttpClientWrapper(HttpClient httpClient, string serviceName, int ma
                 // For success responses, try to deserialize
                 try
                 {
-                    T result = System.Text.Json.JsonSerializer.Deserialize<T>(responseBody, new JsonSerializerOptions
-                    {
-                        PropertyNameCaseInsensitive = true
-                    }) ?? throw new InvalidOperationException("Deserialization returned null");
+                    T result = System.Text.Json.JsonSerializer.Deserialize<T>(responseBody, _jsonOptions) ?? throw new InvalidOperationException("Deserialization returned null");
                     Logs.Debug($"[{_serviceName}] Request successful");
                     return result;
                 }
@@ -7,6 +7,7 @@ using Image = SixLabors.ImageSharp.Image;
 using Font = SixLabors.Fonts.Font;
 using FontFamily = SixLabors.Fonts.FontFamily;
 using PlexBot.Core.Services.LavaLink;
+using SixLabors.ImageSharp.Formats;
 
 namespace PlexBot.Utils;
 
@@ -18,6 +19,20 @@ public static class ImageBuilder
     private static readonly FontCollection _fontCollection = new();
     private static readonly Dictionary<string, Image<Rgba32>> _iconCache = [];
 
+    // Composed artwork backgrounds (blur + overlay + album art) keyed by artwork URL, oldest evicted first
+    private static readonly object _backgroundCacheLock = new();
+    private static readonly Dictionary<string, Image<Rgba32>> _backgroundCache = [];
+    private static readonly Queue<string> _backgroundCacheOrder = new();
+    private const int MaxCachedBackgrounds = 4;
+
+    // Decode at most 500x500, the size Plex already scales artwork to (PlexApiService.ArtworkSize), letting the decoder
+    // scale larger sources down while decoding (JPEG uses reduced-size IDCT). The sharp album art is drawn at 280x280;
+    // the 900x500 background is upscaled from this decode, which the 10px blur applied to it hides
+    private static readonly DecoderOptions _artworkDecoderOptions = new() { TargetSize = new Size(500, 500) };
+
+    // The player image always uses the same four fonts, so they are created once instead of on every render
+    private static readonly Lazy<(Font Title, Font Artist, Font Info, Font SmallInfo)> _playerFonts = new(CreatePlayerFonts);
+
 
     // These paths cover both standard Linux/Docker locations and system-specific ones
     private static readonly string[] _fontPaths =
@@ -120,6 +135,106 @@ public static class ImageBuilder
         }
     }
 
+    /// <summary>Creates the four fonts used on the player image from the loaded font, or any system font as a fallback</summary>
+    private static (Font Title, Font Artist, Font Info, Font SmallInfo) CreatePlayerFonts()
+    {
+        FontFamily family;
+        if (_fontFamily != null)
+        {
+            family = _fontFamily.Value;
+        }
+        else
+        {
+            // Emergency fallback - use any available system font
+            FontFamily fallbackFamily = SystemFonts.Collection.Families.FirstOrDefault();
+            if (fallbackFamily == null)
+            {
+                throw new Exception("No fonts available!");
+            }
+            family = fallbackFamily;
+        }
+        return (family.CreateFont(40, FontStyle.Bold), family.CreateFont(32), family.CreateFont(20), family.CreateFont(16));
+    }
+
+    /// <summary>Composes the artwork-only layers of the player image: blurred, darkened background plus the square album art</summary>
+    private static Image<Rgba32> ComposeBackground(Image<Rgba32> albumArt, int width, int height)
+    {
+        Image<Rgba32> canvas = new(width, height, Color.Black);
+        // Create a blurred copy of the album art for background
+        using Image<Rgba32> backgroundArt = albumArt.Clone();
+        backgroundArt.Mutate(ctx =>
+        {
+            // Resize to fill the background
+            ctx.Resize(new Size(width + 100, height + 100));
+            // Blur the image
+            ctx.GaussianBlur(10f);
+        });
+        // Draw blurred background
+        canvas.Mutate(ctx => ctx.DrawImage(backgroundArt, new Point(-50, -50), 1f));
+        // Add a semi-transparent overlay for better text contrast and darkening
+        canvas.Mutate(ctx =>
+        {
+            // Create a darker overlay
+            ctx.Fill(new Rgba32(0, 0, 0, 180), new RectangleF(0, 0, width, height));
+            // Add gradient effect
+            ctx.Fill(new LinearGradientBrush(
+                new PointF(0, 0),
+                new PointF(width, height),
+                GradientRepetitionMode.None,
+                new ColorStop(0f, new Rgba32(0, 0, 0, 50)),
+                new ColorStop(1f, new Rgba32(0, 0, 0, 100))
+            ), new RectangleF(0, 0, width, height));
+        });
+        // Create a clean version of album art for display
+        using Image<Rgba32> displayArt = albumArt.Clone();
+        displayArt.Mutate(ctx =>
+        {
+            // Make it square if it's not already
+            if (displayArt.Width != displayArt.Height)
+            {
+                int size = Math.Min(displayArt.Width, displayArt.Height);
+                ctx.Crop(new Rectangle(
+                    (displayArt.Width - size) / 2,
+                    (displayArt.Height - size) / 2,
+                    size, size));
+            }
+            // Resize to fit our layout
+            ctx.Resize(new Size(280, 280));
+        });
+        // Draw album art on left side
+        canvas.Mutate(ctx => ctx.DrawImage(displayArt, new Point(40, 60), 1f));
+        return canvas;
+    }
+
+    /// <summary>Returns a private copy of the cached background for this artwork, or null if it isn't cached</summary>
+    private static Image<Rgba32>? TryGetCachedBackground(string artworkUrl)
+    {
+        lock (_backgroundCacheLock)
+        {
+            return _backgroundCache.TryGetValue(artworkUrl, out Image<Rgba32>? background) ? background.Clone() : null;
+        }
+    }
+
+    /// <summary>Stores a copy of a composed background, evicting the oldest entry once the cache is full</summary>
+    private static void CacheBackground(string artworkUrl, Image<Rgba32> canvas)
+    {
+        Image<Rgba32> copy = canvas.Clone();
+        lock (_backgroundCacheLock)
+        {
+            if (!_backgroundCache.TryAdd(artworkUrl, copy))
+            {
+                copy.Dispose();
+                return;
+            }
+            _backgroundCacheOrder.Enqueue(artworkUrl);
+            while (_backgroundCacheOrder.Count > MaxCachedBackgrounds)
+            {
+                if (_backgroundCache.Remove(_backgroundCacheOrder.Dequeue(), out Image<Rgba32>? evicted))
+                    evicted.Dispose();
+            }
+        }
+    }
+
     /// <summary>Creates a visually appealing player image by downloading album art and overlaying track details for Discord display</summary>
     /// <param name="track">Dictionary containing track information</param>
     /// <param name="player">Optional player object to get current state (volume and repeat mode)</param>
@@ -135,106 +250,46 @@ public static class ImageBuilder
             {
                 artworkUrl = "https://via.placeholder.com/150"; // TODO: Add a real placeholder image
             }
-            Image<Rgba32> albumArt;
-            try
-            {
-                // Check prefetch cache first for pre-downloaded artwork
-                byte[]? prefetchedBytes = prefetchService?.GetCachedArtwork(artworkUrl);
-                if (prefetchedBytes != null)
-                {
-                    albumArt = Image.Load<Rgba32>(prefetchedBytes);
-                }
-                else
-                {
-                    // Download artwork directly to memory (no temp file needed)
-                    byte[] imageBytes = await _httpClient!.DownloadBytesAsync(artworkUrl);
-                    albumArt = Image.Load<Rgba32>(imageBytes);
-                }
-            }
-            catch (Exception ex)
-            {
-                Logs.Error($"Failed to download artwork from {artworkUrl}: {ex.Message}");
-                // Create a blank image if download fails
-                albumArt = new Image<Rgba32>(400, 400, Color.DarkGray);
-            }
             // Final image dimensions
             int width = 800;
             int height = 400;
-            // Create our canvas
-            Image<Rgba32> canvas = new(width, height, Color.Black);
+            // The blurred background and album art only depend on the artwork, so re-renders for the same
+            // track (volume, repeat, queue refresh) reuse the composed base instead of re-decoding and re-blurring
+            Image<Rgba32>? canvas = TryGetCachedBackground(artworkUrl);
             try
             {
-                // Create a blurred copy of the album art for background
-                using Image<Rgba32> backgroundArt = albumArt.Clone();
-                backgroundArt.Mutate(ctx =>
-                {
-                    // Resize to fill the background
-                    ctx.Resize(new Size(width + 100, height + 100));
-                    // Blur the image
-                    ctx.GaussianBlur(10f);
-                });
-                // Draw blurred background
-                canvas.Mutate(ctx => ctx.DrawImage(backgroundArt, new Point(-50, -50), 1f));
-                // Add a semi-transparent overlay for better text contrast and darkening
-                canvas.Mutate(ctx =>
+                if (canvas == null)
                 {
-                    // Create a darker overlay
-                    ctx.Fill(new Rgba32(0, 0, 0, 180), new RectangleF(0, 0, width, height));
-                    // Add gradient effect
-                    ctx.Fill(new LinearGradientBrush(
-                        new PointF(0, 0),
-                        new PointF(width, height),
-                        GradientRepetitionMode.None,
-                        new ColorStop(0f, new Rgba32(0, 0, 0, 50)),
-                        new ColorStop(1f, new Rgba32(0, 0, 0, 100))
-                    ), new RectangleF(0, 0, width, height));
-                });
-                // Create a clean version of album art for display
-                using Image<Rgba32> displayArt = albumArt.Clone();
-                displayArt.Mutate(ctx =>
-                {
-                    // Make it square if it's not already
-                    if (displayArt.Width != displayArt.Height)
+                    Image<Rgba32> albumArt;
+                    bool artworkLoaded = false;
+                    try
                     {
-                        int size = Math.Min(displayArt.Width, displayArt.Height);
-                        ctx.Crop(new Rectangle(
-                            (displayArt.Width - size) / 2,
-                            (displayArt.Height - size) / 2,
-                            size, size));
+                        // Prefer the prefetch service: it serves pre-downloaded artwork and otherwise downloads on the
+                        // shared artwork connection pool, caching the result for repeat plays
+                        byte[] imageBytes = prefetchService != null
+                            ? await prefetchService.GetArtworkAsync(artworkUrl)
+                            : await _httpClient!.DownloadBytesAsync(artworkUrl);
+                        albumArt = Image.Load<Rgba32>(_artworkDecoderOptions, imageBytes);
+                        artworkLoaded = true;
                     }
-                    // Resize to fit our layout
-                    ctx.Resize(new Size(280, 280));
-                });
-                // Draw album art on left side
-                canvas.Mutate(ctx => ctx.DrawImage(displayArt, new Point(40, 60), 1f));
-                // Dispose original albumArt - no longer needed after cloning
-                albumArt.Dispose();
-                // Add text information
-                try
-                {
-                    // Get the font for our text
-                    Font titleFont, artistFont, infoFont, smallInfoFont;
-                    if (_fontFamily != null)
+                    catch (Exception ex)
                     {
-                        // Create fonts of different sizes from our loaded font
-                        titleFont = _fontFamily.Value.CreateFont(40, FontStyle.Bold);
-                        artistFont = _fontFamily.Value.CreateFont(32);
-                        infoFont = _fontFamily.Value.CreateFont(20);
-                        smallInfoFont = _fontFamily.Value.CreateFont(16);
+                        Logs.Error($"Failed to download artwork from {artworkUrl}: {ex.Message}");
+                        // Create a blank image if download fails
+                        albumArt = new Image<Rgba32>(400, 400, Color.DarkGray);
                     }
-                    else
+                    using (albumArt)
                     {
-                        // Emergency fallback - use any available system font
-                        FontFamily fallbackFamily = SystemFonts.Collection.Families.FirstOrDefault();
-                        if (fallbackFamily == null)
-                        {
-                            throw new Exception("No fonts available!");
-                        }
-                        titleFont = fallbackFamily.CreateFont(40, FontStyle.Bold);
-                        artistFont = fallbackFamily.CreateFont(32);
-                        infoFont = fallbackFamily.CreateFont(20);
-                        smallInfoFont = fallbackFamily.CreateFont(16);
+                        canvas = ComposeBackground(albumArt, width, height);
                     }
+                    if (artworkLoaded)
+                        CacheBackground(artworkUrl, canvas);
+                }
+                // Add text information
+                try
+                {
+                    // Get the font for our text
+                    (Font titleFont, Font artistFont, Font infoFont, Font smallInfoFont) = _playerFonts.Value;
                     // Helper function to truncate text
                     static string TruncateText(string text, Font font, int maxWidth)
                     {
@@ -187,12 +187,13 @@ namespace PlexBot.Utils
                 lock (Lock)
                 {
                     long seq = Interlocked.Increment(ref LastSequenceID);
-                    Messages.Enqueue(new LogMessage(DateTimeOffset.Now, message, seq));
-                    LastSeq = seq;
-                    if (Messages.Count > MaxTracked)
+                    // Drop the oldest entry before enqueuing so the ring buffer never grows past its preallocated capacity
+                    if (Messages.Count >= MaxTracked)
                     {
                         Messages.Dequeue();
                     }
+                    Messages.Enqueue(new LogMessage(DateTimeOffset.Now, message, seq));
+                    LastSeq = seq;
                 }
             }
         }